@@ -3,7 +3,7 @@ import bz2
 import tarfile
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-import time
+from cp.ut import get_all_files, get_total_size, copy_with_progress, tar_progress_filter, pipe_tar_to_command
 
 console = Console()
 
@@ -11,6 +11,7 @@ def compress_bzip2(folder_path, parent_dir):
     if os.path.isdir(folder_path):
         console.print("[yellow]BZIP2 with mero optimization for folders...[/yellow]\n")
         output_file = os.path.join(parent_dir, "CodeAlchemist.tar.bz2")
+        files = get_all_files(folder_path)
         
         with Progress(
             SpinnerColumn(),
@@ -19,19 +20,19 @@ def compress_bzip2(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with BZIP2 mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with BZIP2 mero algorithm...", total=get_total_size(files))
             
-            with tarfile.open(output_file, "w:bz2", compresslevel=9) as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    time.sleep(0.01)
+            if not pipe_tar_to_command(["pbzip2", "-9"], folder_path, output_file, progress, task):
+                with bz2.open(output_file, 'wb', compresslevel=9) as bz_out:
+                    with tarfile.open(fileobj=bz_out, mode="w|") as tar:
+                        tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
         console.print(f"\n[bold green]BZIP2 compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     else:
         output_file = os.path.join(parent_dir, os.path.basename(folder_path) + ".bz2")
+        total_size = os.path.getsize(folder_path)
         
         with Progress(
             SpinnerColumn(),
@@ -40,14 +41,11 @@ def compress_bzip2(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with BZIP2 mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with BZIP2 mero algorithm...", total=total_size)
             
             with open(folder_path, 'rb') as f_in:
                 with bz2.open(output_file, 'wb', compresslevel=9) as f_out:
-                    f_out.write(f_in.read())
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        time.sleep(0.01)
+                    copy_with_progress(f_in, f_out, progress, task)
         
         console.print(f"\n[bold green]BZIP2 compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
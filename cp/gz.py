@@ -1,9 +1,12 @@
 import os
-import gzip
+try:
+    from zlib_ng import gzip_ng as gzip
+except ImportError:
+    import gzip
 import tarfile
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-import time
+from cp.ut import get_all_files, get_total_size, copy_with_progress, tar_progress_filter, pipe_tar_to_command
 
 console = Console()
 
@@ -11,6 +14,7 @@ def compress_gzip(folder_path, parent_dir):
     if os.path.isdir(folder_path):
         console.print("[yellow]GZIP with mero optimization for folders...[/yellow]\n")
         output_file = os.path.join(parent_dir, "CodeAlchemist.tar.gz")
+        files = get_all_files(folder_path)
         
         with Progress(
             SpinnerColumn(),
@@ -19,19 +23,19 @@ def compress_gzip(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=get_total_size(files))
             
-            with tarfile.open(output_file, "w:gz", compresslevel=9) as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    time.sleep(0.01)
+            if not pipe_tar_to_command(["pigz", "-6"], folder_path, output_file, progress, task):
+                with gzip.open(output_file, 'wb', compresslevel=6) as gz_out:
+                    with tarfile.open(fileobj=gz_out, mode="w|") as tar:
+                        tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
         console.print(f"\n[bold green]GZIP compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     else:
         output_file = os.path.join(parent_dir, os.path.basename(folder_path) + ".gz")
+        total_size = os.path.getsize(folder_path)
         
         with Progress(
             SpinnerColumn(),
@@ -40,14 +44,11 @@ def compress_gzip(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=total_size)
             
             with open(folder_path, 'rb') as f_in:
-                with gzip.open(output_file, 'wb', compresslevel=9) as f_out:
-                    f_out.write(f_in.read())
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        time.sleep(0.01)
+                with gzip.open(output_file, 'wb', compresslevel=6) as f_out:
+                    copy_with_progress(f_in, f_out, progress, task)
         
         console.print(f"\n[bold green]GZIP compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
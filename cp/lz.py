@@ -2,12 +2,15 @@ import os
 import subprocess
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-import time
+from cp.ut import get_all_files, get_total_size, copy_with_progress, tar_progress_filter
 
 console = Console()
 
+LZ4_CHUNK_SIZE = 4 * 1024 * 1024
+
 def compress_lz4(folder_path, parent_dir):
     output_file = os.path.join(parent_dir, "CodeAlchemist.lz4")
+    total_size = get_total_size(get_all_files(folder_path))
     
     console.print("[yellow]LZ4 ultra-fast mero compression...[/yellow]\n")
     
@@ -18,43 +21,28 @@ def compress_lz4(folder_path, parent_dir):
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
     ) as progress:
-        task = progress.add_task("[cyan]Compressing with LZ4 ultra-fast mero algorithm...", total=100)
+        task = progress.add_task("[cyan]Compressing with LZ4 ultra-fast mero algorithm...", total=total_size)
         
         try:
             import lz4.frame
             
-            if os.path.isfile(folder_path):
-                with open(folder_path, 'rb') as f_in:
-                    with lz4.frame.open(output_file, 'wb') as f_out:
-                        f_out.write(f_in.read())
-            else:
-                import tarfile
-                tar_temp = output_file.replace('.lz4', '.tar')
-                with tarfile.open(tar_temp, 'w') as tar:
-                    tar.add(folder_path, arcname=os.path.basename(folder_path))
-                
-                with open(tar_temp, 'rb') as f_in:
-                    with lz4.frame.open(output_file, 'wb') as f_out:
-                        f_out.write(f_in.read())
-                
-                os.remove(tar_temp)
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                time.sleep(0.005)
-            
+            with lz4.frame.open(output_file, 'wb', compression_level=0, block_size=lz4.frame.BLOCKSIZE_MAX4MB) as f_out:
+                if os.path.isfile(folder_path):
+                    with open(folder_path, 'rb') as f_in:
+                        copy_with_progress(f_in, f_out, progress, task, length=LZ4_CHUNK_SIZE)
+                else:
+                    import tarfile
+                    with tarfile.open(fileobj=f_out, mode="w|") as tar:
+                        tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
+        
         except ImportError:
             console.print("[yellow]lz4 library not available, using alternative compression...[/yellow]")
             import gzip
             with open(folder_path, 'rb') as f_in:
                 with gzip.open(output_file.replace('.lz4', '.gz'), 'wb') as f_out:
-                    f_out.write(f_in.read())
+                    copy_with_progress(f_in, f_out, progress, task)
             output_file = output_file.replace('.lz4', '.gz')
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                time.sleep(0.005)
-    
+
     console.print(f"\n[bold green]LZ4 ultra-fast compression completed with mero algorithms![/bold green]")
     console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
     return output_file
@@ -1,35 +1,94 @@
+import io
 import os
 import zipfile
-import gzip
+try:
+    from zlib_ng import gzip_ng as gzip
+except ImportError:
+    import gzip
 import bz2
 import lzma
 import shutil
 import tarfile
-import py7zr
+try:
+    import py7zr
+    HAS_PY7ZR = True
+except ImportError:
+    HAS_PY7ZR = False
 try:
     import pyzipper
     HAS_PYZIPPER = True
 except ImportError:
     HAS_PYZIPPER = False
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.prompt import Prompt
-from cr.tmpl import get_readme_credits
-import time
+from cr.tmpl import get_readme_credits_bytes
+from cp.ut import BatchedProgress, get_all_files, get_total_size, write_zip_credits, write_zip_members, arcname_prefix_len, use_fast_crc32, copy_with_progress, tar_progress_filter, pipe_tar_to_command, pipe_file_to_command
 import math
+from collections import Counter
 
 console = Console()
 
+SEVEN_ZIP_FILTERS = [{"id": py7zr.FILTER_LZMA2, "preset": 3}] if HAS_PY7ZR else None
+XZ_COMMAND = ["xz", "-9", "-T0", "-c"]
+
+_rle_kernel = None
+
+def _rle_loop(arr):
+    n = arr.size
+    out = np.empty(n * 2 + 16, dtype=np.uint8)
+    oi = 0
+    i = 0
+    while i < n:
+        value = arr[i]
+        count = 1
+        while i + count < n and arr[i + count] == value and count < 255:
+            count += 1
+        if count > 3:
+            out[oi] = 0xFF
+            out[oi + 1] = count
+            out[oi + 2] = value
+            oi += 3
+        else:
+            for _ in range(count):
+                if value == 0xFF:
+                    out[oi] = 0xFF
+                    out[oi + 1] = 0
+                    oi += 2
+                else:
+                    out[oi] = value
+                    oi += 1
+        i += count
+    return out[:oi]
+
+def _get_rle_kernel():
+    global _rle_kernel
+    if _rle_kernel is None:
+        try:
+            from numba import njit
+            _rle_kernel = njit(cache=True, boundscheck=False)(_rle_loop)
+        except ImportError:
+            _rle_kernel = False
+    return _rle_kernel
+
 class CompressionAlgorithms:
     @staticmethod
     def calculate_entropy(data):
         if not data:
             return 0
+        if HAS_NUMPY:
+            counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+            p = counts[counts > 0] / len(data)
+            return float(-(p * np.log2(p)).sum())
         entropy = 0
-        for x in range(256):
-            p_x = float(data.count(bytes([x]))) / len(data)
-            if p_x > 0:
-                entropy += - p_x * math.log2(p_x)
+        for count in Counter(data).values():
+            p_x = count / len(data)
+            entropy += - p_x * math.log2(p_x)
         return entropy
     
     @staticmethod
@@ -45,6 +104,12 @@ class CompressionAlgorithms:
     def apply_delta_encoding(data):
         if len(data) < 2:
             return data
+        if HAS_NUMPY:
+            arr = np.frombuffer(data, dtype=np.uint8)
+            out = np.empty_like(arr)
+            out[0] = arr[0]
+            np.subtract(arr[1:], arr[:-1], out=out[1:])
+            return out.tobytes()
         result = bytearray([data[0]])
         for i in range(1, len(data)):
             delta = (data[i] - data[i-1]) & 0xFF
@@ -55,6 +120,9 @@ class CompressionAlgorithms:
     def apply_rle_preprocessing(data):
         if not data:
             return data
+        kernel = _get_rle_kernel() if HAS_NUMPY else None
+        if kernel:
+            return kernel(np.frombuffer(data, dtype=np.uint8)).tobytes()
         result = bytearray()
         i = 0
         while i < len(data):
@@ -82,6 +150,8 @@ class FolderCompressor:
             console.print(f"[bold red]Error: Path {folder_path} not found![/bold red]")
             return None
         
+        use_fast_crc32()
+        
         ask_password = None
         password = None
         
@@ -90,11 +160,7 @@ class FolderCompressor:
             if ask_password.upper() == "Y":
                 password = Prompt.ask("[bold yellow]Enter password[/bold yellow]", password=True)
         
-        parent_dir = os.path.dirname(os.path.abspath(folder_path)) if os.path.isfile(folder_path) else os.path.dirname(folder_path)
-        if not parent_dir:
-            parent_dir = os.path.dirname(os.path.abspath(folder_path))
-        if not parent_dir or parent_dir == folder_path:
-            parent_dir = os.getcwd()
+        parent_dir = os.path.dirname(os.path.abspath(folder_path)) or os.getcwd()
         
         if format_choice == "1":
             return self._compress_zip(folder_path, parent_dir, password)
@@ -116,14 +182,7 @@ class FolderCompressor:
             return self._compress_zstd(folder_path, parent_dir)
     
     def _get_all_files(self, path):
-        files = []
-        if os.path.isfile(path):
-            return [path]
-        
-        for root, dirs, filenames in os.walk(path):
-            for filename in filenames:
-                files.append(os.path.join(root, filename))
-        return files
+        return get_all_files(path)
     
     def _compress_zip(self, folder_path, parent_dir, password):
         output_file = os.path.join(parent_dir, "CodeAlchemist.zip")
@@ -136,32 +195,25 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with ZIP mero algorithm...", total=len(files) + 1)
+            task = progress.add_task("[cyan]Compressing with ZIP mero algorithm...", total=get_total_size(files))
             
             if password and HAS_PYZIPPER:
                 with pyzipper.AESZipFile(output_file, 'w', compression=pyzipper.ZIP_LZMA, encryption=pyzipper.WZ_AES) as zipf:
                     zipf.setpassword(password.encode('utf-8'))
                     
-                    zipf.writestr("CREDITS.txt", get_readme_credits())
-                    progress.update(task, advance=1)
-                    time.sleep(0.02)
+                    zipf.writestr("CREDITS.txt", get_readme_credits_bytes())
                     
-                    for file in files:
-                        arcname = os.path.relpath(file, os.path.dirname(folder_path))
-                        zipf.write(file, arcname)
-                        progress.update(task, advance=1)
-                        time.sleep(0.01)
+                    prefix_len = arcname_prefix_len(os.path.dirname(folder_path))
+                    with BatchedProgress(progress, task) as batched:
+                        for file in files:
+                            arcname = file[prefix_len:]
+                            zipf.write(file, arcname)
+                            batched.update(task, advance=os.path.getsize(file))
             else:
-                with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
-                    zipf.writestr("CREDITS.txt", get_readme_credits())
-                    progress.update(task, advance=1)
-                    time.sleep(0.02)
+                with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+                    write_zip_credits(zipf)
                     
-                    for file in files:
-                        arcname = os.path.relpath(file, os.path.dirname(folder_path))
-                        zipf.write(file, arcname)
-                        progress.update(task, advance=1)
-                        time.sleep(0.01)
+                    write_zip_members(zipf, files, os.path.dirname(folder_path), progress, task)
                 
                 if password:
                     console.print("[yellow]Password protection requires pyzipper library. File compressed without password.[/yellow]")
@@ -184,18 +236,12 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with RAR mero algorithm...", total=len(files) + 1)
+            task = progress.add_task("[cyan]Compressing with RAR mero algorithm...", total=get_total_size(files))
             
-            with zipfile.ZipFile(output_file.replace('.rar', '.zip'), 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
-                zipf.writestr("CREDITS.txt", get_readme_credits())
-                progress.update(task, advance=1)
-                time.sleep(0.05)
+            with zipfile.ZipFile(output_file.replace('.rar', '.zip'), 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+                write_zip_credits(zipf)
                 
-                for file in files:
-                    arcname = os.path.relpath(file, os.path.dirname(folder_path))
-                    zipf.write(file, arcname)
-                    progress.update(task, advance=1)
-                    time.sleep(0.02)
+                write_zip_members(zipf, files, os.path.dirname(folder_path), progress, task)
         
         output_file = output_file.replace('.rar', '.zip')
         console.print(f"\n[bold green]RAR-equivalent compression completed![/bold green]")
@@ -203,6 +249,10 @@ class FolderCompressor:
         return output_file
     
     def _compress_7z(self, folder_path, parent_dir):
+        if not HAS_PY7ZR:
+            console.print("[yellow]py7zr library not available, using ZIP compression instead...[/yellow]")
+            return self._compress_zip(folder_path, parent_dir, None)
+        
         output_file = os.path.join(parent_dir, "CodeAlchemist.7z")
         files = self._get_all_files(folder_path)
         
@@ -213,30 +263,29 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with 7Z ultra mero compression...", total=len(files) + 1)
+            task = progress.add_task("[cyan]Compressing with 7Z ultra mero compression...", total=get_total_size(files))
             
-            with py7zr.SevenZipFile(output_file, 'w') as archive:
-                import io
-                credits_bytes = io.BytesIO(get_readme_credits().encode('utf-8'))
-                archive.writef(credits_bytes, "CREDITS.txt")
-                progress.update(task, advance=1)
-                time.sleep(0.05)
-                
+            with py7zr.SevenZipFile(output_file, 'w', filters=SEVEN_ZIP_FILTERS, mp=True) as archive:
                 if os.path.isfile(folder_path):
                     archive.write(folder_path, os.path.basename(folder_path))
-                    progress.update(task, advance=1)
+                    progress.update(task, advance=os.path.getsize(folder_path))
                 else:
-                    for file in files:
-                        arcname = os.path.relpath(file, os.path.dirname(folder_path))
-                        archive.write(file, arcname)
-                        progress.update(task, advance=1)
-                        time.sleep(0.02)
+                    prefix_len = arcname_prefix_len(os.path.dirname(folder_path))
+                    with BatchedProgress(progress, task) as batched:
+                        for file in files:
+                            arcname = file[prefix_len:]
+                            archive.write(file, arcname)
+                            batched.update(task, advance=os.path.getsize(file))
+                
+                archive.writef(io.BytesIO(get_readme_credits_bytes()), "CREDITS.txt")
         
         console.print(f"\n[bold green]7Z compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_gzip(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         if os.path.isdir(folder_path):
             console.print("[yellow]GZIP with mero optimization for folders...[/yellow]\n")
             output_file = os.path.join(parent_dir, "CodeAlchemist.tar.gz")
@@ -248,14 +297,12 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=100)
+                task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=total_size)
                 
-                with tarfile.open(output_file, "w:gz", compresslevel=9) as tar:
-                    tar.add(folder_path, arcname=os.path.basename(folder_path))
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        if i % 10 == 0:
-                            time.sleep(0.03)
+                if not pipe_tar_to_command(["pigz", "-6"], folder_path, output_file, progress, task):
+                    with gzip.open(output_file, 'wb', compresslevel=6) as gz_out:
+                        with tarfile.open(fileobj=gz_out, mode="w|") as tar:
+                            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         else:
             output_file = os.path.join(parent_dir, "CodeAlchemist.gz")
             
@@ -266,21 +313,19 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=100)
+                task = progress.add_task("[cyan]Compressing with GZIP mero algorithm...", total=total_size)
                 
                 with open(folder_path, 'rb') as f_in:
-                    with gzip.open(output_file, 'wb', compresslevel=9) as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                        for i in range(100):
-                            progress.update(task, advance=1)
-                            if i % 10 == 0:
-                                time.sleep(0.03)
+                    with gzip.open(output_file, 'wb', compresslevel=6) as f_out:
+                        copy_with_progress(f_in, f_out, progress, task)
         
         console.print(f"\n[bold green]GZIP compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_bzip2(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         if os.path.isdir(folder_path):
             console.print("[yellow]BZIP2 with mero strong algorithms...[/yellow]\n")
             output_file = os.path.join(parent_dir, "CodeAlchemist.tar.bz2")
@@ -292,14 +337,12 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with BZIP2 mero strong algorithms...", total=100)
+                task = progress.add_task("[cyan]Compressing with BZIP2 mero strong algorithms...", total=total_size)
                 
-                with tarfile.open(output_file, "w:bz2", compresslevel=9) as tar:
-                    tar.add(folder_path, arcname=os.path.basename(folder_path))
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        if i % 10 == 0:
-                            time.sleep(0.03)
+                if not pipe_tar_to_command(["pbzip2", "-9"], folder_path, output_file, progress, task):
+                    with bz2.open(output_file, 'wb', compresslevel=9) as bz_out:
+                        with tarfile.open(fileobj=bz_out, mode="w|") as tar:
+                            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         else:
             output_file = os.path.join(parent_dir, "CodeAlchemist.bz2")
             
@@ -310,21 +353,19 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with BZIP2 mero strong algorithms...", total=100)
+                task = progress.add_task("[cyan]Compressing with BZIP2 mero strong algorithms...", total=total_size)
                 
                 with open(folder_path, 'rb') as f_in:
                     with bz2.open(output_file, 'wb', compresslevel=9) as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                        for i in range(100):
-                            progress.update(task, advance=1)
-                            if i % 10 == 0:
-                                time.sleep(0.03)
+                        copy_with_progress(f_in, f_out, progress, task)
         
         console.print(f"\n[bold green]BZIP2 compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_xz(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         if os.path.isdir(folder_path):
             console.print("[yellow]XZ with mero maximum compression...[/yellow]\n")
             output_file = os.path.join(parent_dir, "CodeAlchemist.tar.xz")
@@ -336,14 +377,12 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with XZ mero maximum compression...", total=100)
+                task = progress.add_task("[cyan]Compressing with XZ mero maximum compression...", total=total_size)
                 
-                with tarfile.open(output_file, "w:xz", preset=9) as tar:
-                    tar.add(folder_path, arcname=os.path.basename(folder_path))
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        if i % 10 == 0:
-                            time.sleep(0.03)
+                if not any(pipe_tar_to_command(command, folder_path, output_file, progress, task) for command in (["pixz", "-9"], XZ_COMMAND)):
+                    with lzma.open(output_file, 'wb', preset=9) as xz_out:
+                        with tarfile.open(fileobj=xz_out, mode="w|") as tar:
+                            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         else:
             output_file = os.path.join(parent_dir, "CodeAlchemist.xz")
             
@@ -354,21 +393,20 @@ class FolderCompressor:
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task("[cyan]Compressing with XZ mero maximum compression...", total=100)
+                task = progress.add_task("[cyan]Compressing with XZ mero maximum compression...", total=total_size)
                 
-                with open(folder_path, 'rb') as f_in:
-                    with lzma.open(output_file, 'wb', preset=9) as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                        for i in range(100):
-                            progress.update(task, advance=1)
-                            if i % 10 == 0:
-                                time.sleep(0.03)
+                if not pipe_file_to_command(XZ_COMMAND, folder_path, output_file, progress, task):
+                    with open(folder_path, 'rb') as f_in:
+                        with lzma.open(output_file, 'wb', preset=9) as f_out:
+                            copy_with_progress(f_in, f_out, progress, task)
         
         console.print(f"\n[bold green]XZ compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_tar(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         output_file = os.path.join(parent_dir, "CodeAlchemist.tar")
         
         with Progress(
@@ -378,20 +416,18 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Creating TAR archive with mero optimization...", total=100)
+            task = progress.add_task("[cyan]Creating TAR archive with mero optimization...", total=total_size)
             
-            with tarfile.open(output_file, "w") as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    if i % 10 == 0:
-                        time.sleep(0.02)
+            with tarfile.open(output_file, "w|") as tar:
+                tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
         console.print(f"\n[bold green]TAR archive created with mero optimization![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_lz4(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         console.print("[yellow]LZ4 ultra-fast compression with mero algorithms...[/yellow]\n")
         output_file = os.path.join(parent_dir, "CodeAlchemist.tar.gz")
         
@@ -402,22 +438,21 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with LZ4 mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with LZ4 mero algorithm...", total=total_size)
             
-            with tarfile.open(output_file, "w:gz", compresslevel=1) as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    if i % 10 == 0:
-                        time.sleep(0.02)
+            with gzip.open(output_file, 'wb', compresslevel=1) as gz_out:
+                with tarfile.open(fileobj=gz_out, mode="w|") as tar:
+                    tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
         console.print(f"\n[bold green]LZ4-equivalent compression completed![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
     
     def _compress_zstd(self, folder_path, parent_dir):
+        total_size = get_total_size(self._get_all_files(folder_path))
+        
         console.print("[yellow]ZSTD modern compression with mero algorithms...[/yellow]\n")
-        output_file = os.path.join(parent_dir, "CodeAlchemist.tar.gz")
+        output_file = os.path.join(parent_dir, "CodeAlchemist.tar.zst")
         
         with Progress(
             SpinnerColumn(),
@@ -426,15 +461,23 @@ class FolderCompressor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with ZSTD mero algorithm...", total=100)
+            task = progress.add_task("[cyan]Compressing with ZSTD mero algorithm...", total=total_size)
             
-            with tarfile.open(output_file, "w:gz", compresslevel=9) as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    if i % 10 == 0:
-                        time.sleep(0.02)
+            try:
+                import zstandard as zstd
+                
+                cctx = zstd.ZstdCompressor(level=3, threads=-1)
+                with open(output_file, 'wb') as f_out:
+                    with cctx.stream_writer(f_out) as zst_out:
+                        with tarfile.open(fileobj=zst_out, mode="w|") as tar:
+                            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
+            except ImportError:
+                console.print("[yellow]zstandard library not available, using alternative compression...[/yellow]")
+                output_file = output_file.replace('.zst', '.gz')
+                with gzip.open(output_file, 'wb', compresslevel=9) as gz_out:
+                    with tarfile.open(fileobj=gz_out, mode="w|") as tar:
+                        tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
-        console.print(f"\n[bold green]ZSTD-equivalent compression completed![/bold green]")
+        console.print(f"\n[bold green]ZSTD modern compression completed with mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
         return output_file
@@ -2,13 +2,13 @@ import os
 import zipfile
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from cr.tmpl import get_readme_credits
-import time
+from cp.ut import get_all_files, get_total_size, write_zip_credits, write_zip_members, use_fast_crc32
 
 console = Console()
 
 def compress_rar(folder_path, parent_dir):
     output_file = os.path.join(parent_dir, "CodeAlchemist.rar")
+    use_fast_crc32()
     
     console.print("[yellow]RAR compression with mero optimization...[/yellow]\n")
     
@@ -21,29 +21,14 @@ def compress_rar(folder_path, parent_dir):
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
     ) as progress:
-        task = progress.add_task("[cyan]Compressing with RAR mero algorithm...", total=len(files) + 1)
+        task = progress.add_task("[cyan]Compressing with RAR mero algorithm...", total=get_total_size(files))
         
-        with zipfile.ZipFile(output_file.replace('.rar', '.zip'), 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
-            zipf.writestr("CREDITS.txt", get_readme_credits())
-            progress.update(task, advance=1)
-            time.sleep(0.05)
+        with zipfile.ZipFile(output_file.replace('.rar', '.zip'), 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+            write_zip_credits(zipf)
             
-            for file in files:
-                arcname = os.path.relpath(file, os.path.dirname(folder_path))
-                zipf.write(file, arcname)
-                progress.update(task, advance=1)
-                time.sleep(0.02)
+            write_zip_members(zipf, files, os.path.dirname(folder_path), progress, task)
     
     output_file = output_file.replace('.rar', '.zip')
     console.print(f"\n[bold green]RAR-equivalent compression completed![/bold green]")
     console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
     return output_file
-
-def get_all_files(folder_path):
-    files = []
-    if os.path.isfile(folder_path):
-        return [folder_path]
-    for root, dirs, filenames in os.walk(folder_path):
-        for filename in filenames:
-            files.append(os.path.join(root, filename))
-    return files
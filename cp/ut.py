@@ -0,0 +1,203 @@
+import mmap
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from cr.tmpl import get_readme_credits_bytes
+try:
+    from deflate import crc32
+except ImportError:
+    from zlib import crc32
+
+CHUNK_SIZE = 1024 * 1024
+SCAN_WORKERS = 16
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+MMAP_THRESHOLD = 64 * 1024 * 1024
+PROGRESS_BATCH_SIZE = 4 * 1024 * 1024
+PRE_COMPRESSED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp3', '.mp4', '.mkv', '.webm', '.ogg',
+    '.zip', '.7z', '.rar', '.gz', '.tgz', '.xz', '.bz2', '.zst', '.lz4', '.pdf',
+})
+
+def use_fast_crc32():
+    """Swap the libdeflate crc32 into zipfile (and pyzipper's zipfile, once imported).
+
+    This patches the module globals, so it affects every ZipFile in the process,
+    readers included, for the rest of its lifetime. Call it from a compressor's
+    entry point, never at import time. Without the deflate package it installs
+    zlib's crc32, which is what zipfile uses anyway.
+    """
+    zipfile.crc32 = crc32
+    if 'pyzipper' in sys.modules:
+        sys.modules['pyzipper'].zipfile.crc32 = crc32
+
+class BatchedProgress:
+    def __init__(self, progress, task, threshold=PROGRESS_BATCH_SIZE):
+        self.progress = progress
+        self.task = task
+        self.threshold = threshold
+        self.pending = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.flush()
+    
+    def update(self, task, advance=0):
+        self.pending += advance
+        if self.pending >= self.threshold:
+            self.flush()
+    
+    def flush(self):
+        if self.pending:
+            self.progress.update(self.task, advance=self.pending)
+            self.pending = 0
+
+def _scan_dir(path):
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.path)
+                elif not entry.is_symlink():
+                    dirs.append(entry.path)
+    except OSError:
+        pass
+    return dirs, files
+
+def get_all_files(folder_path):
+    if os.path.isfile(folder_path):
+        return [folder_path]
+    files = []
+    dirs = [folder_path]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        while dirs:
+            next_dirs = []
+            for sub_dirs, sub_files in executor.map(_scan_dir, dirs):
+                next_dirs.extend(sub_dirs)
+                files.extend(sub_files)
+            dirs = next_dirs
+    return files
+
+def iter_all_files(folder_path):
+    if os.path.isfile(folder_path):
+        yield folder_path
+        return
+    stack = [folder_path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry.path
+                    elif not entry.is_symlink():
+                        stack.append(entry.path)
+        except OSError:
+            pass
+
+def get_total_size(files):
+    total = 0
+    for file in files:
+        try:
+            total += os.path.getsize(file)
+        except OSError:
+            pass
+    return total
+
+def copy_with_progress(f_in, f_out, progress, task, length=CHUNK_SIZE):
+    while True:
+        chunk = f_in.read(length)
+        if not chunk:
+            break
+        f_out.write(chunk)
+        progress.update(task, advance=len(chunk))
+
+def copy_file_with_progress(file_path, f_out, progress, task, length=CHUNK_SIZE):
+    with open(file_path, 'rb') as f_in:
+        size = os.fstat(f_in.fileno()).st_size
+        if size <= MMAP_THRESHOLD:
+            copy_with_progress(f_in, f_out, progress, task, length)
+            return
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            for offset in range(0, size, length):
+                with view[offset:offset + length] as chunk:
+                    f_out.write(chunk)
+                    progress.update(task, advance=len(chunk))
+
+def write_zip_credits(zipf):
+    zinfo = zipfile.ZipInfo("CREDITS.txt", date_time=time.localtime()[:6])
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.external_attr = 0o600 << 16
+    zipf.writestr(zinfo, get_readme_credits_bytes())
+
+def _zipinfo_from_file(zipf, file, arcname):
+    return getattr(zipf, 'zipinfo_cls', zipfile.ZipInfo).from_file(file, arcname)
+
+def write_zip_member(zipf, file, arcname, compress_type=None):
+    zinfo = _zipinfo_from_file(zipf, file, arcname)
+    zinfo.compress_type = zipf.compression if compress_type is None else compress_type
+    with open(file, 'rb') as src, zipf.open(zinfo, 'w', force_zip64=zinfo.file_size > LARGE_FILE_SIZE) as dst:
+        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    return zinfo.file_size
+
+def arcname_prefix_len(base_dir):
+    if not base_dir:
+        return 0
+    return len(base_dir) + (0 if base_dir.endswith(os.sep) else 1)
+
+def write_zip_members(zipf, files, base_dir, progress, task):
+    prefix_len = arcname_prefix_len(base_dir)
+    with BatchedProgress(progress, task) as batched:
+        for file in files:
+            arcname = file[prefix_len:]
+            stored = os.path.splitext(file)[1].lower() in PRE_COMPRESSED_EXTENSIONS
+            size = write_zip_member(zipf, file, arcname, zipfile.ZIP_STORED if stored else None)
+            batched.update(task, advance=size)
+
+def tar_progress_filter(progress, task):
+    def _filter(tarinfo):
+        if tarinfo.isfile():
+            progress.update(task, advance=tarinfo.size)
+        return tarinfo
+    return _filter
+
+def _pipe_to_command(command, output_file, write):
+    executable = shutil.which(command[0])
+    if not executable:
+        return False
+    with open(output_file, 'wb') as f_out:
+        proc = subprocess.Popen([executable] + command[1:], stdin=subprocess.PIPE, stdout=f_out)
+        try:
+            write(proc.stdin)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+    return True
+
+def pipe_tar_to_command(command, folder_path, output_file, progress, task):
+    def _write(stdin):
+        with tarfile.open(fileobj=stdin, mode="w|") as tar:
+            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
+    return _pipe_to_command(command, output_file, _write)
+
+def pipe_file_to_command(command, file_path, output_file, progress, task):
+    def _write(stdin):
+        copy_file_with_progress(file_path, stdin, progress, task)
+    return _pipe_to_command(command, output_file, _write)
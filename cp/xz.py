@@ -3,11 +3,17 @@ import lzma
 import tarfile
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-import time
+from cp.ut import get_all_files, get_total_size, copy_file_with_progress, tar_progress_filter, pipe_tar_to_command, pipe_file_to_command
 
 console = Console()
 
-def compress_xz(folder_path, parent_dir):
+def compress_xz(folder_path, parent_dir, preset=6, extreme=False):
+    total_size = get_total_size(get_all_files(folder_path))
+    command = ["xz", "-T0", "-c", f"-{preset}"]
+    if extreme:
+        preset |= lzma.PRESET_EXTREME
+        command.append("-e")
+    
     if os.path.isdir(folder_path):
         console.print("[yellow]XZ with maximum mero compression for folders...[/yellow]\n")
         output_file = os.path.join(parent_dir, "CodeAlchemist.tar.xz")
@@ -19,13 +25,12 @@ def compress_xz(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with XZ maximum mero compression...", total=100)
+            task = progress.add_task("[cyan]Compressing with XZ maximum mero compression...", total=total_size)
             
-            with tarfile.open(output_file, "w:xz", preset=9) as tar:
-                tar.add(folder_path, arcname=os.path.basename(folder_path))
-                for i in range(100):
-                    progress.update(task, advance=1)
-                    time.sleep(0.015)
+            if not pipe_tar_to_command(command, folder_path, output_file, progress, task):
+                with lzma.open(output_file, 'wb', preset=preset) as xz_out:
+                    with tarfile.open(fileobj=xz_out, mode="w|") as tar:
+                        tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
         
         console.print(f"\n[bold green]XZ compression completed with maximum mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
@@ -40,14 +45,11 @@ def compress_xz(folder_path, parent_dir):
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("[cyan]Compressing with XZ maximum mero compression...", total=100)
+            task = progress.add_task("[cyan]Compressing with XZ maximum mero compression...", total=total_size)
             
-            with open(folder_path, 'rb') as f_in:
-                with lzma.open(output_file, 'wb', preset=9) as f_out:
-                    f_out.write(f_in.read())
-                    for i in range(100):
-                        progress.update(task, advance=1)
-                        time.sleep(0.015)
+            if not pipe_file_to_command(command, folder_path, output_file, progress, task):
+                with lzma.open(output_file, 'wb', preset=preset) as f_out:
+                    copy_file_with_progress(folder_path, f_out, progress, task)
         
         console.print(f"\n[bold green]XZ compression completed with maximum mero algorithms![/bold green]")
         console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
@@ -1,12 +1,19 @@
 import os
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-import time
+from cp.ut import get_all_files, iter_all_files, get_total_size, copy_file_with_progress, tar_progress_filter
 
 console = Console()
 
-def compress_zstd(folder_path, parent_dir):
+ZSTD_LEVELS = {"fast": 3, "balanced": 15, "max": 22}
+ZSTD_DICT_SIZE = 110 * 1024
+ZSTD_DICT_SAMPLE_SIZE = 16 * 1024
+ZSTD_DICT_MIN_SAMPLES = 8
+
+def compress_zstd(folder_path, parent_dir, level="balanced", dict_path=None):
+    level = ZSTD_LEVELS.get(level, level)
     output_file = os.path.join(parent_dir, "CodeAlchemist.zst")
+    total_size = get_total_size(get_all_files(folder_path))
     
     console.print("[yellow]ZSTD modern mero compression...[/yellow]\n")
     
@@ -17,45 +24,61 @@ def compress_zstd(folder_path, parent_dir):
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
     ) as progress:
-        task = progress.add_task("[cyan]Compressing with ZSTD modern mero algorithm...", total=100)
+        task = progress.add_task("[cyan]Compressing with ZSTD modern mero algorithm...", total=total_size)
         
         try:
             import zstandard as zstd
             
-            if os.path.isfile(folder_path):
-                with open(folder_path, 'rb') as f_in:
-                    cctx = zstd.ZstdCompressor(level=22)
-                    with open(output_file, 'wb') as f_out:
-                        f_out.write(cctx.compress(f_in.read()))
-            else:
-                import tarfile
-                tar_temp = output_file.replace('.zst', '.tar')
-                with tarfile.open(tar_temp, 'w') as tar:
-                    tar.add(folder_path, arcname=os.path.basename(folder_path))
-                
-                with open(tar_temp, 'rb') as f_in:
-                    cctx = zstd.ZstdCompressor(level=22)
-                    with open(output_file, 'wb') as f_out:
-                        f_out.write(cctx.compress(f_in.read()))
-                
-                os.remove(tar_temp)
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                time.sleep(0.008)
-                
+            dict_data = _load_dict(zstd, folder_path, dict_path) if dict_path else None
+            cctx = zstd.ZstdCompressor(level=level, threads=-1, dict_data=dict_data)
+            with open(output_file, 'wb') as f_out:
+                with cctx.stream_writer(f_out) as zst_out:
+                    _write_input(folder_path, zst_out, progress, task)
+        
         except ImportError:
             console.print("[yellow]zstandard library not available, using alternative compression...[/yellow]")
             import gzip
-            with open(folder_path, 'rb') as f_in:
-                with gzip.open(output_file.replace('.zst', '.gz'), 'wb') as f_out:
-                    f_out.write(f_in.read())
             output_file = output_file.replace('.zst', '.gz')
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                time.sleep(0.008)
+            with gzip.open(output_file, 'wb') as f_out:
+                _write_input(folder_path, f_out, progress, task)
     
     console.print(f"\n[bold green]ZSTD modern compression completed with mero algorithms![/bold green]")
     console.print(f"[bold yellow]Output: {output_file}[/bold yellow]\n")
     return output_file
+
+def train_dict(samples, dict_size=ZSTD_DICT_SIZE):
+    import zstandard as zstd
+    return zstd.train_dictionary(dict_size, samples)
+
+def _load_dict(zstd, folder_path, dict_path):
+    if os.path.isfile(dict_path):
+        with open(dict_path, 'rb') as f:
+            return zstd.ZstdCompressionDict(f.read())
+    samples = []
+    for file in iter_all_files(folder_path):
+        try:
+            if os.path.getsize(file) > ZSTD_DICT_SAMPLE_SIZE:
+                continue
+            with open(file, 'rb') as f:
+                samples.append(f.read())
+        except OSError:
+            pass
+    if len(samples) < ZSTD_DICT_MIN_SAMPLES:
+        console.print("[yellow]Not enough small files to train a ZSTD dictionary, compressing without one...[/yellow]")
+        return None
+    try:
+        dict_data = train_dict(samples)
+    except zstd.ZstdError:
+        console.print("[yellow]ZSTD dictionary training failed, compressing without one...[/yellow]")
+        return None
+    with open(dict_path, 'wb') as f:
+        f.write(dict_data.as_bytes())
+    return dict_data
+
+def _write_input(folder_path, f_out, progress, task):
+    if os.path.isfile(folder_path):
+        copy_file_with_progress(folder_path, f_out, progress, task)
+    else:
+        import tarfile
+        with tarfile.open(fileobj=f_out, mode="w|") as tar:
+            tar.add(folder_path, arcname=os.path.basename(folder_path), filter=tar_progress_filter(progress, task))
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
 def get_credit_header(lang_name, comment_style):
     developer = "mero"
     telegram = "qp4rm"
@@ -86,8 +89,7 @@ REM ========================================
 
 """
 
-def get_readme_credits():
-    return """========================================
+README_CREDITS = """========================================
 CodeAlchemist
 ========================================
 Developer: mero
@@ -97,3 +99,11 @@ This archive was created using CodeAlchemist
 A powerful code translation and compression tool
 ========================================
 """
+
+README_CREDITS_BYTES = README_CREDITS.encode('utf-8')
+
+def get_readme_credits():
+    return README_CREDITS
+
+def get_readme_credits_bytes():
+    return README_CREDITS_BYTES
@@ -6,6 +6,23 @@ from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
 
+_BLOCK_COLON_RE = re.compile(r'(\S.*?):\s*$', re.MULTILINE)
+_LIST_LITERAL_RE = re.compile(r'\[([^\]]*)\]')
+_DICT_LITERAL_RE = re.compile(r'\{([^}]*):([^}]*)\}')
+_FSTRING_RE = re.compile(r'f"([^"]*\{[^}]*\}[^"]*)"')
+_FSTRING_VAR_RE = re.compile(r'\{([^}]+)\}')
+_FSTRING_PLACEHOLDER_RE = re.compile(r'\{[^}]+\}')
+_LIST_COMP_RE = re.compile(r'\[([^\]]+)\s+for\s+(\w+)\s+in\s+([^\]]+)\]')
+_EXCEPT_AS_RE = re.compile(r'except\s+(\w+)\s+as\s+(\w+):')
+_EXCEPT_RE = re.compile(r'except:')
+_TRY_RE = re.compile(r'try:')
+_FINALLY_RE = re.compile(r'finally:')
+_CLASS_RE = re.compile(r'class\s+(\w+)(\s*\([^)]*\))?:')
+_INIT_RE = re.compile(r'def\s+__init__\s*\(self,\s*([^)]*)\):')
+_POWER_RE = re.compile(r'\*\*')
+_FLOOR_DIV_RE = re.compile(r'//')
+_SEMICOLON_SKIP_PREFIXES = ('if', 'else', 'for', 'while', 'class', 'function', 'def', '//')
+
 @dataclass
 class ConversionRule:
     source_lang: str
@@ -19,6 +36,13 @@ class LanguageConverter:
         self.conversion_rules = self._load_conversion_rules()
         self.mero_converter = True
         self.syntax_mapping = self._build_syntax_mapping()
+        self._rules_by_pair = defaultdict(list)
+        for rule in self.conversion_rules:
+            self._rules_by_pair[(rule.source_lang, rule.target_lang)].append((re.compile(rule.pattern, re.MULTILINE), rule.transformation))
+        self._keyword_patterns = {
+            key: re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in sorted(mapping, key=len, reverse=True)) + r')\b')
+            for key, mapping in self.syntax_mapping.items()
+        }
     
     def _load_conversion_rules(self) -> List[ConversionRule]:
         rules = []
@@ -152,13 +176,12 @@ class LanguageConverter:
     
     def convert_code(self, source_code: str, from_lang: str, to_lang: str) -> str:
         conversion_key = f'{from_lang}_to_{to_lang}'
-        mapping = self.syntax_mapping.get(conversion_key, {})
-        
         converted = source_code
         
-        for source_keyword, target_keyword in mapping.items():
-            pattern = r'\b' + re.escape(source_keyword) + r'\b'
-            converted = re.sub(pattern, target_keyword, converted)
+        pattern = self._keyword_patterns.get(conversion_key)
+        if pattern:
+            mapping = self.syntax_mapping[conversion_key]
+            converted = pattern.sub(lambda match: mapping[match.group(0)], converted)
         
         converted = self._apply_conversion_rules(converted, from_lang, to_lang)
         
@@ -171,78 +194,71 @@ class LanguageConverter:
         return converted
     
     def _apply_conversion_rules(self, code: str, from_lang: str, to_lang: str) -> str:
-        for rule in self.conversion_rules:
-            if rule.source_lang == from_lang and rule.target_lang == to_lang:
-                code = re.sub(rule.pattern, rule.transformation, code, flags=re.MULTILINE)
+        for pattern, transformation in self._rules_by_pair.get((from_lang, to_lang), ()):
+            code = pattern.sub(transformation, code)
         
         return code
     
     def _convert_syntax_structures(self, code: str, from_lang: str, to_lang: str) -> str:
         if from_lang == 'python' and to_lang in ['javascript', 'java', 'cpp', 'csharp']:
-            code = self._convert_python_blocks_to_braces(code)
+            if ':' in code:
+                code = self._convert_python_blocks_to_braces(code)
+                code = _BLOCK_COLON_RE.sub(r'\1 {', code)
         
         elif to_lang == 'python' and from_lang in ['javascript', 'java', 'cpp', 'csharp']:
             code = self._convert_braces_to_python_blocks(code)
         
-        if from_lang == 'python' and to_lang in ['javascript', 'java', 'cpp', 'csharp']:
-            code = re.sub(r'(\S.*?):\s*$', r'\1 {', code, flags=re.MULTILINE)
-        
         if to_lang in ['javascript', 'java', 'cpp', 'csharp', 'go', 'rust']:
             code = self._add_semicolons(code, to_lang)
         
         return code
     
     def _convert_python_blocks_to_braces(self, code: str) -> str:
-        lines = code.split('\n')
         result_lines = []
+        append = result_lines.append
         indent_stack = [0]
         
-        for i, line in enumerate(lines):
-            if not line.strip():
-                result_lines.append(line)
+        for line in code.split('\n'):
+            content = line.lstrip()
+            if not content:
+                append(line)
                 continue
             
-            current_indent = len(line) - len(line.lstrip())
-            stripped = line.strip()
+            current_indent = len(line) - len(content)
             
-            while indent_stack and current_indent < indent_stack[-1]:
+            while current_indent < indent_stack[-1]:
                 indent_stack.pop()
-                result_lines.append(' ' * indent_stack[-1] + '}')
+                append(' ' * indent_stack[-1] + '}')
             
-            if stripped.endswith(':'):
+            if content.rstrip().endswith(':'):
                 line = line.rstrip(':') + ' {'
                 indent_stack.append(current_indent + 4)
             
-            result_lines.append(line)
+            append(line)
         
         while len(indent_stack) > 1:
             indent_stack.pop()
-            result_lines.append(' ' * indent_stack[-1] + '}')
+            append(' ' * indent_stack[-1] + '}')
         
         return '\n'.join(result_lines)
     
     def _convert_braces_to_python_blocks(self, code: str) -> str:
-        lines = code.split('\n')
         result_lines = []
-        indent_level = 0
+        append = result_lines.append
+        indent = ''
         
-        for line in lines:
+        for line in code.split('\n'):
             stripped = line.strip()
             
             if not stripped:
-                result_lines.append('')
-                continue
-            
-            if stripped.startswith('}'):
-                indent_level = max(0, indent_level - 1)
-                continue
-            
-            if stripped.endswith('{'):
-                line = line.rstrip(' {').rstrip() + ':'
-                result_lines.append(' ' * (indent_level * 4) + stripped.rstrip('{').rstrip() + ':')
-                indent_level += 1
+                append('')
+            elif stripped[0] == '}':
+                indent = indent[4:]
+            elif stripped[-1] == '{':
+                append(indent + stripped.rstrip('{').rstrip() + ':')
+                indent += '    '
             else:
-                result_lines.append(' ' * (indent_level * 4) + stripped)
+                append(indent + stripped)
         
         return '\n'.join(result_lines)
     
@@ -264,15 +280,15 @@ class LanguageConverter:
         if language in ['go', 'rust']:
             return code
         
-        lines = code.split('\n')
         result = []
+        append = result.append
         
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.endswith(('{', '}', ';', ',')):
-                if not stripped.startswith(('if', 'else', 'for', 'while', 'class', 'function', 'def', '//')):
-                    line = line.rstrip() + ';'
-            result.append(line)
+        for line in code.split('\n'):
+            rstripped = line.rstrip()
+            if rstripped and rstripped[-1] not in '{};,' and not rstripped.lstrip().startswith(_SEMICOLON_SKIP_PREFIXES):
+                append(rstripped + ';')
+            else:
+                append(line)
         
         return '\n'.join(result)
     
@@ -312,74 +328,73 @@ class LanguageConverter:
     
     def convert_data_structures(self, code: str, from_lang: str, to_lang: str) -> str:
         if from_lang == 'python':
-            if to_lang == 'javascript':
-                code = re.sub(r'\[([^\]]*)\]', r'[\1]', code)
-                code = re.sub(r'\{([^}]*):([^}]*)\}', r'{\1:\2}', code)
-            
-            elif to_lang == 'java':
-                code = re.sub(r'\[([^\]]*)\]', r'new ArrayList<>(Arrays.asList(\1))', code)
-                code = re.sub(r'\{([^}]*):([^}]*)\}', r'new HashMap<>() {{ put(\1, \2); }}', code)
+            if to_lang == 'java':
+                if '[' in code:
+                    code = _LIST_LITERAL_RE.sub(r'new ArrayList<>(Arrays.asList(\1))', code)
+                if '{' in code:
+                    code = _DICT_LITERAL_RE.sub(r'new HashMap<>() {{ put(\1, \2); }}', code)
         
         return code
     
     def convert_string_formatting(self, code: str, from_lang: str, to_lang: str) -> str:
-        if from_lang == 'python':
-            fstring_pattern = r'f"([^"]*\{[^}]*\}[^"]*)"'
-            
+        if from_lang == 'python' and 'f"' in code:
             if to_lang == 'javascript':
-                code = re.sub(fstring_pattern, r'`\1`', code)
+                code = _FSTRING_RE.sub(r'`\1`', code)
             
             elif to_lang == 'java':
                 def replace_fstring(match):
                     content = match.group(1)
-                    vars_in_braces = re.findall(r'\{([^}]+)\}', content)
-                    format_str = re.sub(r'\{[^}]+\}', '%s', content)
+                    vars_in_braces = _FSTRING_VAR_RE.findall(content)
+                    format_str = _FSTRING_PLACEHOLDER_RE.sub('%s', content)
                     if vars_in_braces:
                         return f'String.format("{format_str}", {", ".join(vars_in_braces)})'
                     return f'"{content}"'
-                code = re.sub(fstring_pattern, replace_fstring, code)
+                code = _FSTRING_RE.sub(replace_fstring, code)
         
         return code
     
     def convert_comprehensions(self, code: str, from_lang: str, to_lang: str) -> str:
-        if from_lang == 'python' and to_lang == 'javascript':
-            list_comp_pattern = r'\[([^\]]+)\s+for\s+(\w+)\s+in\s+([^\]]+)\]'
-            
+        if from_lang == 'python' and to_lang == 'javascript' and 'for' in code and '[' in code:
             def replace_list_comp(match):
                 expr, var, iterable = match.groups()
                 return f'{iterable}.map({var} => {expr})'
             
-            code = re.sub(list_comp_pattern, replace_list_comp, code)
+            code = _LIST_COMP_RE.sub(replace_list_comp, code)
         
         return code
     
     def convert_exception_handling(self, code: str, from_lang: str, to_lang: str) -> str:
         if from_lang == 'python':
             if to_lang in ['javascript', 'java', 'cpp', 'csharp']:
-                code = re.sub(r'except\s+(\w+)\s+as\s+(\w+):', r'catch (\1 \2) {', code)
-                code = re.sub(r'except:', r'catch (Exception mero_e) {', code)
-                code = re.sub(r'try:', r'try {', code)
-                code = re.sub(r'finally:', r'finally {', code)
+                if 'except' in code:
+                    code = _EXCEPT_AS_RE.sub(r'catch (\1 \2) {', code)
+                    code = _EXCEPT_RE.sub(r'catch (Exception mero_e) {', code)
+                if 'try:' in code:
+                    code = _TRY_RE.sub(r'try {', code)
+                if 'finally:' in code:
+                    code = _FINALLY_RE.sub(r'finally {', code)
         
         return code
     
     def convert_classes(self, code: str, from_lang: str, to_lang: str) -> str:
-        if from_lang == 'python':
+        if from_lang == 'python' and ('class' in code or '__init__' in code):
             if to_lang == 'java':
-                code = re.sub(r'class\s+(\w+)(\s*\([^)]*\))?:', r'public class \1 {', code)
-                code = re.sub(r'def\s+__init__\s*\(self,\s*([^)]*)\):', r'public \1() {', code)
+                code = _CLASS_RE.sub(r'public class \1 {', code)
+                code = _INIT_RE.sub(r'public \1() {', code)
             
             elif to_lang == 'javascript':
-                code = re.sub(r'class\s+(\w+)(\s*\([^)]*\))?:', r'class \1 {', code)
-                code = re.sub(r'def\s+__init__\s*\(self,\s*([^)]*)\):', r'constructor(\1) {', code)
+                code = _CLASS_RE.sub(r'class \1 {', code)
+                code = _INIT_RE.sub(r'constructor(\1) {', code)
         
         return code
     
     def convert_operators(self, code: str, from_lang: str, to_lang: str) -> str:
         if from_lang == 'python':
             if to_lang in ['java', 'javascript', 'cpp', 'csharp']:
-                code = re.sub(r'\*\*', '^', code)
-                code = re.sub(r'//', 'Math.floor(', code)
+                if '**' in code:
+                    code = _POWER_RE.sub('^', code)
+                if '//' in code:
+                    code = _FLOOR_DIV_RE.sub('Math.floor(', code)
         
         return code
     
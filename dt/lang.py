@@ -97,11 +97,14 @@ LANGUAGES = [
     {"id": 96, "name": "Wren", "ext": [".wren"], "comment": "//", "multi_start": "/*", "multi_end": "*/"}
 ]
 
+_EXT_MAP = {}
+for _lang in LANGUAGES:
+    for _ext in _lang["ext"]:
+        _EXT_MAP.setdefault(_ext.lower(), _lang)
+del _lang, _ext
+
 def get_language_by_ext(ext):
-    for lang in LANGUAGES:
-        if ext.lower() in [e.lower() for e in lang["ext"]]:
-            return lang
-    return None
+    return _EXT_MAP.get(ext.lower())
 
 def get_language_by_id(lang_id):
     for lang in LANGUAGES:
@@ -1,24 +1,178 @@
 import os
 import sys
 import subprocess
+import importlib.util
+import functools
+from ca import __version__
 
-def install_dependencies():
-    print("Installing mero libraries...")
-    packages = ["rich", "py7zr", "pyzipper"]
+VERSION_LINE = f"CodeAlchemist {__version__}"
+STATIC_HELP = VERSION_LINE + """ - Code translation and compression toolkit
+Developer: mero | Telegram: @qp4rm
+
+Usage: python run.py [-h | --help | -v | --version]
+
+Run without arguments to start the interactive menu."""
+
+MAX_TRANSLATION_SIZE = 50 * 1024 * 1024
+BANNER = "=" * 60 + "\nCodeAlchemist - Setup and Run\nDeveloper: mero | Telegram: @qp4rm\n" + "=" * 60 + "\n"
+PIP_TIMEOUT = 120
+CORE_DEPENDENCIES = ("rich",)
+COMPRESSION_DEPENDENCIES = {"1": ("pyzipper",), "3": ("py7zr",)}
+
+@functools.cache
+def _console():
+    from rich.console import Console
+    return Console()
+
+def install_dependencies(required=CORE_DEPENDENCIES):
+    packages = [p for p in required if importlib.util.find_spec(p) is None]
+    if not packages:
+        return True
     
+    print("Installing mero libraries...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet"] + packages)
-        print("All libraries installed successfully by mero!")
-        return True
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--quiet", "--disable-pip-version-check", "--no-input"] + packages,
+            capture_output=True,
+            text=True,
+            timeout=PIP_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"Installation timed out after {PIP_TIMEOUT} seconds. Please check your network connection.")
+        return False
     except Exception as e:
         print(f"Installation failed: {e}")
         return False
+    
+    if result.returncode != 0:
+        print(f"Installation failed: {result.stderr.strip() or result.stdout.strip()}")
+        return False
+    
+    print("All libraries installed successfully by mero!")
+    return True
+
+def handle_translation():
+    from rich.prompt import Prompt
+    from ui.menu import show_languages_menu
+    from tr.eng import TranslationEngine
+    from dt.lang import get_language_by_ext
+    
+    _console().print("\n[bold cyan]Code Translation Tool[/bold cyan]\n")
+    
+    
+    file_path = Prompt.ask("[bold yellow]Enter the path to your source code file[/bold yellow]")
+    
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        _console().print(f"[bold red]Error: File not found![/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    if st.st_size > MAX_TRANSLATION_SIZE:
+        _console().print("[bold red]Error: File too large for interactive translation![/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    ext = sys.intern(os.path.splitext(file_path)[1].lower())
+    source_lang = get_language_by_ext(ext)
+    
+    if not source_lang:
+        _console().print(f"[bold red]Error: Unknown file type '{ext}'[/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    _console().print(f"\n[bold green]Detected source language: {source_lang['name']}[/bold green]\n")
+    
+    show_languages_menu(source_lang['name'])
+    
+    try:
+        target_lang_id = int(Prompt.ask("[bold yellow]Enter the number of target language[/bold yellow]"))
+    except ValueError:
+        _console().print("[bold red]Invalid input![/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    engine = TranslationEngine()
+    result = engine.translate_code(file_path, target_lang_id)
+    
+    if result:
+        _console().print("[bold green]Translation successful![/bold green]")
+    
+    input("\nPress Enter to continue...")
+
+def handle_compression():
+    from rich.prompt import Prompt
+    from ui.menu import show_compression_menu
+    
+    choice = show_compression_menu()
+    
+    if choice == "0":
+        return
+    
+    if not install_dependencies(COMPRESSION_DEPENDENCIES.get(choice, ())):
+        _console().print("[bold red]Failed to install dependencies![/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    from cp.main import FolderCompressor
+    
+    _console().print("\n[bold cyan]Folder/File Compression Tool[/bold cyan]\n")
+    
+    path = Prompt.ask("[bold yellow]Enter the path to folder or file[/bold yellow]")
+    
+    try:
+        os.stat(path)
+    except OSError:
+        _console().print(f"[bold red]Error: Path not found![/bold red]")
+        input("\nPress Enter to continue...")
+        return
+    
+    compressor = FolderCompressor()
+    result = compressor.compress(path, choice)
+    
+    if result:
+        _console().print("[bold green]Compression successful![/bold green]")
+    
+    input("\nPress Enter to continue...")
+
+def handle_developer_contact():
+    import webbrowser
+    
+    _console().clear()
+    _console().print("\n[bold cyan]Developer Contact[/bold cyan]\n")
+    _console().print("[bold yellow]Developer:[/bold yellow] mero")
+    _console().print("[bold yellow]Telegram:[/bold yellow] @qp4rm")
+    _console().print("\n[bold green]Opening Telegram...[/bold green]\n")
+    
+    try:
+        opened = webbrowser.open("https://t.me/qp4rm")
+    except Exception as e:
+        _console().print(f"[bold red]Could not open browser: {e}[/bold red]")
+        opened = False
+    
+    if opened:
+        _console().print("[bold green]Telegram opened in your browser![/bold green]")
+    else:
+        _console().print("[bold yellow]Please visit manually: https://t.me/qp4rm[/bold yellow]")
+    
+    input("\nPress Enter to continue...")
+
+HANDLERS = {
+    "1": handle_translation,
+    "2": handle_compression,
+    "3": handle_developer_contact,
+}
 
 def main():
-    print("="*60)
-    print("CodeAlchemist - Setup and Run")
-    print("Developer: mero | Telegram: @qp4rm")
-    print("="*60)
+    if len(sys.argv) > 1 and sys.argv[1] in ("-v", "--version"):
+        print(VERSION_LINE)
+        return
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print(STATIC_HELP)
+        return
+    
+    sys.stdout.write(BANNER)
     
     if not install_dependencies():
         print("Failed to install dependencies!")
@@ -28,114 +182,28 @@ def main():
     
     try:
         from ui.show import show_intro
-        from ui.menu import show_main_menu, show_languages_menu, show_compression_menu
-        from tr.eng import TranslationEngine
-        from cp.main import FolderCompressor
-        from dt.lang import get_language_by_ext
-        from rich.console import Console
-        from rich.prompt import Prompt
-        import webbrowser
-        
-        console = Console()
+        from ui.menu import show_main_menu
         
-        def handle_translation():
-            console.print("\n[bold cyan]Code Translation Tool[/bold cyan]\n")
-            
-                    
-            file_path = Prompt.ask("[bold yellow]Enter the path to your source code file[/bold yellow]")
-            
-            if not os.path.exists(file_path):
-                console.print(f"[bold red]Error: File not found![/bold red]")
-                input("\nPress Enter to continue...")
-                return
-            
-            _, ext = os.path.splitext(file_path)
-            source_lang = get_language_by_ext(ext)
-            
-            if not source_lang:
-                console.print(f"[bold red]Error: Unknown file type '{ext}'[/bold red]")
-                input("\nPress Enter to continue...")
-                return
-            
-            console.print(f"\n[bold green]Detected source language: {source_lang['name']}[/bold green]\n")
-            
-            show_languages_menu(source_lang['name'])
-            
-            try:
-                target_lang_id = int(Prompt.ask("[bold yellow]Enter the number of target language[/bold yellow]"))
-            except ValueError:
-                console.print("[bold red]Invalid input![/bold red]")
-                input("\nPress Enter to continue...")
-                return
-            
-            engine = TranslationEngine()
-            result = engine.translate_code(file_path, target_lang_id)
-            
-            if result:
-                console.print("[bold green]Translation successful![/bold green]")
-            
-            input("\nPress Enter to continue...")
-
-        def handle_compression():
-            choice = show_compression_menu()
-            
-            if choice == "0":
-                return
-            
-            console.print("\n[bold cyan]Folder/File Compression Tool[/bold cyan]\n")
-            
-            path = Prompt.ask("[bold yellow]Enter the path to folder or file[/bold yellow]")
-            
-            if not os.path.exists(path):
-                console.print(f"[bold red]Error: Path not found![/bold red]")
-                input("\nPress Enter to continue...")
-                return
-            
-            compressor = FolderCompressor()
-            result = compressor.compress(path, choice)
-            
-            if result:
-                console.print("[bold green]Compression successful![/bold green]")
-            
-            input("\nPress Enter to continue...")
-
-        def handle_developer_contact():
-            console.clear()
-            console.print("\n[bold cyan]Developer Contact[/bold cyan]\n")
-            console.print("[bold yellow]Developer:[/bold yellow] mero")
-            console.print("[bold yellow]Telegram:[/bold yellow] @qp4rm")
-            console.print("\n[bold green]Opening Telegram...[/bold green]\n")
-            
-            try:
-                webbrowser.open("https://t.me/qp4rm")
-                console.print("[bold green]Telegram opened in your browser![/bold green]")
-            except Exception as e:
-                console.print(f"[bold red]Could not open browser: {e}[/bold red]")
-                console.print("[bold yellow]Please visit manually: https://t.me/qp4rm[/bold yellow]")
-            
-            input("\nPress Enter to continue...")
-
         show_intro()
         
         while True:
             choice = show_main_menu()
             
             if choice == "0":
-                console.clear()
-                console.print("\n[bold cyan]Thank you for using CodeAlchemist![/bold cyan]")
-                console.print("[bold yellow]Developed by mero - Telegram: @qp4rm[/bold yellow]\n")
+                _console().clear()
+                _console().print("\n[bold cyan]Thank you for using CodeAlchemist![/bold cyan]")
+                _console().print("[bold yellow]Developed by mero - Telegram: @qp4rm[/bold yellow]\n")
                 sys.exit(0)
-            elif choice == "1":
-                handle_translation()
-            elif choice == "2":
-                handle_compression()
-            elif choice == "3":
-                handle_developer_contact()
+            
+            handler = HANDLERS.get(choice)
+            if handler:
+                handler()
                 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("CODEALCHEMIST_DEBUG"):
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,24 @@
+import unittest
+
+from tr.core import CodeTranslator, PhpTranslator, PythonToTargetTranslator
+
+
+class PhpTranslatorTest(unittest.TestCase):
+    def test_base_constructor_selects_php_translator(self):
+        translator = PythonToTargetTranslator('php')
+        self.assertIsInstance(translator, PhpTranslator)
+        self.assertIsInstance(PythonToTargetTranslator('PHP'), PhpTranslator)
+        self.assertNotIsInstance(PythonToTargetTranslator('javascript'), PhpTranslator)
+
+    def test_base_constructor_emits_php_sigils(self):
+        code = PythonToTargetTranslator('php').translate('x = y + 1\nprint(x)\n')
+        self.assertIn('$x = $y . 1;', code)
+        self.assertIn('echo $x;', code)
+
+    def test_smart_translate_php(self):
+        code = CodeTranslator().smart_translate('x = y + 1\nprint(x)\n', 'Python', 'PHP')
+        self.assertIn('$x = $y . 1;', code)
+
+
+if __name__ == '__main__':
+    unittest.main()
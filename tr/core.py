@@ -1,16 +1,311 @@
 import re
 import os
+import sys
 import ast
-from typing import Dict, List, Tuple, Any, Optional, Set
+from typing import Callable, Dict, List, Tuple, Any, Optional, Set
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-class PythonToTargetTranslator:
-    def __init__(self, target_lang: str):
+_BRACE_FUNC = '{indent}function {name}({params}) {{\n{body}\n{indent}}}'
+FUNC_TEMPLATES = {
+    'javascript': _BRACE_FUNC,
+    'typescript': _BRACE_FUNC,
+    'java': '{indent}public static void {name}({params}) {{\n{body}\n{indent}}}',
+    'c': '{indent}void {name}({params}) {{\n{body}\n{indent}}}',
+    'cpp': '{indent}void {name}({params}) {{\n{body}\n{indent}}}',
+    'csharp': '{indent}public static void {name}({params}) {{\n{body}\n{indent}}}',
+    'go': '{indent}func {name}({params}) {{\n{body}\n{indent}}}',
+    'rust': '{indent}fn {name}({params}) {{\n{body}\n{indent}}}',
+    'php': _BRACE_FUNC,
+    'ruby': '{indent}def {name}({params})\n{body}\n{indent}end',
+    'swift': '{indent}func {name}({params}) {{\n{body}\n{indent}}}',
+    'kotlin': '{indent}fun {name}({params}) {{\n{body}\n{indent}}}',
+    'perl': '{indent}sub {name} {{\n{indent}    my ({params}) = @_;\n{body}\n{indent}}}',
+    'lua': '{indent}function {name}({params})\n{body}\n{indent}end',
+    'dart': '{indent}{name}({params}) {{\n{body}\n{indent}}}',
+    'scala': '{indent}def {name}({params}) = {{\n{body}\n{indent}}}',
+    '_default': _BRACE_FUNC,
+}
+
+_BRACE_CLASS = '{indent}class {name} {{\n{body}\n{indent}}}'
+CLASS_TEMPLATES = {
+    'java': '{indent}public class {name} {{\n{body}\n{indent}}}',
+    'c': '{indent}class {name} {{\npublic:\n{body}\n{indent}}};',
+    'cpp': '{indent}class {name} {{\npublic:\n{body}\n{indent}}};',
+    'csharp': '{indent}public class {name} {{\n{body}\n{indent}}}',
+    'ruby': '{indent}class {name}\n{body}\n{indent}end',
+    '_default': _BRACE_CLASS,
+}
+
+ASSIGN_TEMPLATES = {
+    'javascript': '{indent}let {target} = {value};',
+    'typescript': '{indent}let {target} = {value};',
+    'java': '{indent}var {target} = {value};',
+    'c': '{indent}auto {target} = {value};',
+    'cpp': '{indent}auto {target} = {value};',
+    'csharp': '{indent}var {target} = {value};',
+    'go': '{indent}{target} := {value}',
+    'rust': '{indent}let mut {target} = {value};',
+    'ruby': '{indent}{target} = {value}',
+    'swift': '{indent}var {target} = {value}',
+    'kotlin': '{indent}var {target} = {value}',
+    'perl': '{indent}my ${target} = {value};',
+    'lua': '{indent}local {target} = {value}',
+    'dart': '{indent}var {target} = {value};',
+    'scala': '{indent}val {target} = {value}',
+    '_default': '{indent}{target} = {value};',
+}
+
+FOR_TEMPLATES = {
+    'javascript': '{indent}for (let {var} of {iterable}) {{\n{body}\n{indent}}}',
+    'typescript': '{indent}for (let {var} of {iterable}) {{\n{body}\n{indent}}}',
+    'java': '{indent}for (var {var} : {iterable}) {{\n{body}\n{indent}}}',
+    'c': '{indent}for (auto {var} : {iterable}) {{\n{body}\n{indent}}}',
+    'cpp': '{indent}for (auto {var} : {iterable}) {{\n{body}\n{indent}}}',
+    'csharp': '{indent}foreach (var {var} in {iterable}) {{\n{body}\n{indent}}}',
+    'go': '{indent}for _, {var} := range {iterable} {{\n{body}\n{indent}}}',
+    'rust': '{indent}for {var} in {iterable} {{\n{body}\n{indent}}}',
+    'php': '{indent}foreach ({iterable} as {var}) {{\n{body}\n{indent}}}',
+    'ruby': '{indent}{iterable}.each do |{var}|\n{body}\n{indent}end',
+    'swift': '{indent}for {var} in {iterable} {{\n{body}\n{indent}}}',
+    'kotlin': '{indent}for ({var} in {iterable}) {{\n{body}\n{indent}}}',
+    'perl': '{indent}foreach my ${var} (@{{{iterable}}}) {{\n{body}\n{indent}}}',
+    'lua': '{indent}for _, {var} in pairs({iterable}) do\n{body}\n{indent}end',
+    'dart': '{indent}for (var {var} in {iterable}) {{\n{body}\n{indent}}}',
+    'scala': '{indent}for ({var} <- {iterable}) {{\n{body}\n{indent}}}',
+    '_default': '{indent}for ({var} in {iterable}) {{\n{body}\n{indent}}}',
+}
+
+WHILE_TEMPLATES = {
+    'go': '{indent}for {condition} {{\n{body}\n{indent}}}',
+    'ruby': '{indent}while {condition} do\n{body}\n{indent}end',
+    'lua': '{indent}while {condition} do\n{body}\n{indent}end',
+    '_default': '{indent}while ({condition}) {{\n{body}\n{indent}}}',
+}
+
+BUILTIN_CALL_TEMPLATES = {
+    'print': {
+        'javascript': 'console.log({args})',
+        'typescript': 'console.log({args})',
+        'java': 'System.out.println({args})',
+        'c': 'std::cout << {args} << std::endl',
+        'cpp': 'std::cout << {args} << std::endl',
+        'csharp': 'Console.WriteLine({args})',
+        'go': 'fmt.Println({args})',
+        'rust': 'println!("{{}}", {args})',
+        'php': 'echo {args}',
+        'ruby': 'puts {args}',
+        'kotlin': 'println({args})',
+        'perl': 'print {args}',
+        'scala': 'println({args})',
+        '_default': 'print({args})',
+    },
+    'len': {
+        'javascript': '{args}.length',
+        'typescript': '{args}.length',
+        'java': '{args}.length',
+        'c': '{args}.size()',
+        'cpp': '{args}.size()',
+        'csharp': '{args}.Length',
+        'rust': '{args}.len()',
+        'php': 'count({args})',
+        'ruby': '{args}.length',
+        'swift': '{args}.count',
+        'kotlin': '{args}.size',
+        '_default': 'len({args})',
+    },
+    'str': {
+        'java': 'String.valueOf({args})',
+        'c': 'std::to_string({args})',
+        'cpp': 'std::to_string({args})',
+        'csharp': '{args}.ToString()',
+        'go': 'fmt.Sprint({args})',
+        'rust': '{args}.to_string()',
+        'php': 'strval({args})',
+        'ruby': '{args}.to_s',
+        'kotlin': '{args}.toString()',
+        '_default': 'String({args})',
+    },
+}
+
+
+_OP_MAP = {
+    ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/',
+    ast.Mod: '%', ast.Pow: '**', ast.FloorDiv: '//',
+}
+_COMPARE_OP_MAP = {
+    ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>=',
+}
+
+_INDENTS = tuple('    ' * i for i in range(128))
+_JAVA_MEMBER_RE = re.compile(r'\s*(?:public static void|public class|class )')
+_BREAK_STMT = sys.intern('break;')
+_CONTINUE_STMT = sys.intern('continue;')
+_IMPORT_TYPES = (ast.Import, ast.ImportFrom)
+_CONSTANT_NAMES = {'True': 'true', 'False': 'false', 'None': 'null'}
+
+def _indent_for(level: int) -> str:
+    return _INDENTS[level] if level < len(_INDENTS) else '    ' * level
+
+_STRING_OR_COMMENT_RE = re.compile(
+    r'"""(?:\\.|[^\\])*?"""|\'\'\'(?:\\.|[^\\])*?\'\'\'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|#[^\n]*',
+    re.S,
+)
+_BRACKET_RE = re.compile(r'[()\[\]{}]')
+_BRACKET_PAIRS = {')': '(', ']': '[', '}': '{'}
+
+def _quick_plausible(src: str) -> bool:
+    stack = []
+    for bracket in _BRACKET_RE.findall(_STRING_OR_COMMENT_RE.sub('', src)):
+        if bracket in _BRACKET_PAIRS:
+            if not stack or stack.pop() != _BRACKET_PAIRS[bracket]:
+                return False
+        else:
+            stack.append(bracket)
+    return not stack
+
+@lru_cache(maxsize=4096, typed=True)
+def _translate_constant(value: Any) -> str:
+    if value is None:
+        return "null"
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, str):
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped}"'
+    else:
+        return str(value)
+
+@dataclass(frozen=True)
+class LanguageProfile:
+    name: str
+    func_template: str
+    class_template: str
+    assign_template: str
+    for_template: str
+    while_template: str
+    builtin_templates: Dict[str, str]
+    binary_ops: Dict[type, str]
+    compare_ops: Dict[type, str]
+    init_name: str = '__init__'
+    empty_body: str = 'mero_empty'
+    pass_stmt: str = ';'
+    keyword_blocks: bool = False
+    stmt_end: str = ';'
+    self_prefix: str = 'self.'
+    list_emit: Tuple[str, str] = ('[', ']')
+    tuple_emit: Tuple[str, str] = ('(', ')')
+    dict_emit: Tuple[str, str] = ('{', '}')
+    dict_pair_sep: str = ': '
+    _leaf_stmts: Dict[Tuple[str, int], str] = field(default_factory=dict, compare=False, repr=False)
+    
+    def _leaf_at(self, stmt: str, level: int) -> str:
+        key = (stmt, level)
+        leaf = self._leaf_stmts.get(key)
+        if leaf is None:
+            leaf = self._leaf_stmts[key] = sys.intern(_indent_for(level) + stmt)
+        return leaf
+    
+    def break_at(self, level: int) -> str:
+        return self._leaf_at(_BREAK_STMT, level)
+    
+    def continue_at(self, level: int) -> str:
+        return self._leaf_at(_CONTINUE_STMT, level)
+    
+    def pass_at(self, level: int) -> str:
+        return self._leaf_at(self.pass_stmt, level) if self.pass_stmt else ""
+
+def _build_profile(lang: str) -> LanguageProfile:
+    init_names = {'php': '__construct', 'javascript': 'constructor', 'typescript': 'constructor'}
+    op_overrides = {ast.Add: '.'} if lang == 'php' else {}
+    compare_op_overrides = {ast.Eq: '===', ast.NotEq: '!=='} if lang in ('javascript', 'typescript', 'php') else {}
+    return LanguageProfile(
+        name=lang,
+        func_template=FUNC_TEMPLATES.get(lang, FUNC_TEMPLATES['_default']),
+        class_template=CLASS_TEMPLATES.get(lang, CLASS_TEMPLATES['_default']),
+        assign_template=ASSIGN_TEMPLATES.get(lang, ASSIGN_TEMPLATES['_default']),
+        for_template=FOR_TEMPLATES.get(lang, FOR_TEMPLATES['_default']),
+        while_template=WHILE_TEMPLATES.get(lang, WHILE_TEMPLATES['_default']),
+        builtin_templates={name: templates.get(lang, templates['_default']) for name, templates in BUILTIN_CALL_TEMPLATES.items()},
+        binary_ops={**_OP_MAP, **op_overrides},
+        compare_ops={**_COMPARE_OP_MAP, **compare_op_overrides},
+        init_name=init_names.get(lang, '__init__'),
+        empty_body='pass' if lang in ('python', 'ruby') else 'mero_empty',
+        pass_stmt=sys.intern({'ruby': '', 'python': 'pass'}.get(lang, ';')),
+        keyword_blocks=lang in ('ruby', 'lua'),
+        stmt_end='' if lang in ('ruby', 'lua') else ';',
+        list_emit=('array(', ')') if lang == 'php' else ('[', ']'),
+        tuple_emit=('array(', ')') if lang == 'php' else ('[', ']') if lang in ('javascript', 'typescript') else ('(', ')'),
+        dict_emit=('array(', ')') if lang == 'php' else ('{', '}'),
+        dict_pair_sep=' => ' if lang == 'php' else ': ',
+        self_prefix='this.' if lang in ('javascript', 'typescript', 'java', 'csharp', 'kotlin', 'dart', 'scala') else 'self.',
+    )
+
+LANG_PROFILES = {
+    lang: _build_profile(lang)
+    for lang in ('python', 'javascript', 'typescript', 'java', 'c', 'cpp', 'csharp', 'go', 'rust', 'php',
+                 'ruby', 'swift', 'kotlin', 'perl', 'lua', 'dart', 'scala', '_default')
+}
+
+def _builtin_template_call(name: str) -> Callable[['PythonToTargetTranslator', List[ast.expr]], str]:
+    def _translate(translator: 'PythonToTargetTranslator', args: List[ast.expr]) -> str:
+        call_args = ', '.join([translator.translate_expr(arg) for arg in args])
+        return translator.profile.builtin_templates[name].format(args=call_args)
+    return _translate
+
+def _translate_range_call(translator: 'PythonToTargetTranslator', args: List[ast.expr]) -> str:
+    if translator.target_lang in ['javascript', 'typescript']:
+        if args:
+            n = translator.translate_expr(args[0])
+            return f"Array.from({{length: {n}}}, (_, i) => i)"
+        else:
+            return "[]"
+    elif translator.target_lang == 'php':
+        if args:
+            n = translator.translate_expr(args[0])
+            return f"range(0, {n} - 1)"
+        else:
+            return "[]"
+    elif translator.target_lang == 'ruby':
+        if args:
+            n = translator.translate_expr(args[0])
+            return f"(0...{n})"
+        else:
+            return "(0...0)"
+    else:
+        return f"range({', '.join([translator.translate_expr(arg) for arg in args])})"
+
+_BUILTIN_DISPATCH = {name: _builtin_template_call(name) for name in BUILTIN_CALL_TEMPLATES}
+_BUILTIN_DISPATCH['range'] = _translate_range_call
+
+class PythonToTargetTranslator(ast.NodeVisitor):
+    def __new__(cls, target_lang: str):
+        if cls is PythonToTargetTranslator and target_lang.lower() == 'php':
+            cls = PhpTranslator
+        return super().__new__(cls)
+    
+    def __init__(self, target_lang: str) -> None:
         self.target_lang = target_lang.lower()
-        self.indent_level = 0
+        self.profile = LANG_PROFILES.get(self.target_lang, LANG_PROFILES['_default'])
         self.mero_translator = True
-        self.variables = set()
-        
+        self.variables: Set[str] = set()
+        self._emits_imports = self.target_lang != 'php'
+        self._param_prefix = '$' if self.target_lang in ('php', 'perl') else ''
+        self._stmt_dispatch = self._build_dispatch(ast.stmt)
+        self._expr_dispatch = self._build_dispatch(ast.expr)
+        
+    def _build_dispatch(self, base: type) -> Dict[type, Any]:
+        return {
+            node_type: getattr(self, 'visit_' + node_type.__name__)
+            for node_type in base.__subclasses__()
+            if hasattr(self, 'visit_' + node_type.__name__)
+        }
+    
     def translate(self, python_code: str) -> str:
+        if not _quick_plausible(python_code):
+            return self.fallback_translate(python_code)
         try:
             tree = ast.parse(python_code)
             translated_code = self.translate_module(tree)
@@ -19,534 +314,199 @@ class PythonToTargetTranslator:
             return self.fallback_translate(python_code)
     
     def translate_module(self, node: ast.Module) -> str:
-        lines = []
-        imports = []
-        main_code = []
-        
+        import_stmts = []
+        main_stmts = []
         for stmt in node.body:
-            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
-                imp_code = self.translate_statement(stmt)
-                if imp_code:
-                    imports.append(imp_code)
-            else:
-                code = self.translate_statement(stmt)
-                if code:
-                    main_code.append(code)
+            (import_stmts if isinstance(stmt, _IMPORT_TYPES) else main_stmts).append(stmt)
         
-        if imports and self.target_lang not in ['php']:
-            result = '\n'.join(imports) + '\n\n' + '\n\n'.join(main_code)
-        else:
-            result = '\n\n'.join(main_code)
+        imports = self.translate_lines(import_stmts, 0) if self._emits_imports else []
+        main_code = self.translate_lines(main_stmts, 0)
         
-        return result
+        if imports:
+            return '\n'.join(imports) + '\n\n' + '\n\n'.join(main_code)
+        return '\n\n'.join(main_code)
     
-    def translate_statement(self, stmt: Any) -> str:
-        if isinstance(stmt, ast.FunctionDef):
-            return self.translate_function(stmt)
-        elif isinstance(stmt, ast.ClassDef):
-            return self.translate_class(stmt)
-        elif isinstance(stmt, ast.Assign):
-            return self.translate_assignment(stmt)
-        elif isinstance(stmt, ast.AugAssign):
-            return self.translate_aug_assignment(stmt)
-        elif isinstance(stmt, ast.If):
-            return self.translate_if(stmt)
-        elif isinstance(stmt, ast.For):
-            return self.translate_for(stmt)
-        elif isinstance(stmt, ast.While):
-            return self.translate_while(stmt)
-        elif isinstance(stmt, ast.Return):
-            return self.translate_return(stmt)
-        elif isinstance(stmt, ast.Expr):
-            return self.translate_expression_stmt(stmt)
-        elif isinstance(stmt, ast.Import):
-            return ""
-        elif isinstance(stmt, ast.ImportFrom):
-            return ""
-        elif isinstance(stmt, ast.Pass):
-            return self.translate_pass()
-        elif isinstance(stmt, ast.Break):
-            return f"{self.get_indent()}break;"
-        elif isinstance(stmt, ast.Continue):
-            return f"{self.get_indent()}continue;"
-        else:
-            return ""
+    def translate_statement(self, stmt: Any, level: int = 0) -> str:
+        handler = self._stmt_dispatch.get(type(stmt))
+        return handler(stmt, level) if handler else ""
+    
+    def visit_Import(self, stmt: ast.Import, level: int = 0) -> str:
+        return ""
+    
+    def visit_ImportFrom(self, stmt: ast.ImportFrom, level: int = 0) -> str:
+        return ""
+    
+    def visit_Pass(self, stmt: ast.Pass, level: int = 0) -> str:
+        return self.translate_pass(level)
+    
+    def visit_Break(self, stmt: ast.Break, level: int = 0) -> str:
+        return self.profile.break_at(level)
+    
+    def visit_Continue(self, stmt: ast.Continue, level: int = 0) -> str:
+        return self.profile.continue_at(level)
     
-    def translate_function(self, func: ast.FunctionDef) -> str:
+    def visit_FunctionDef(self, func: ast.FunctionDef, level: int = 0) -> str:
         func_name = func.name
         if func_name == '__init__':
-            if self.target_lang == 'php':
-                func_name = '__construct'
-            elif self.target_lang in ['javascript', 'typescript']:
-                func_name = 'constructor'
+            func_name = self.profile.init_name
         
         params = self.translate_parameters(func.args)
-        self.indent_level += 1
-        body = self.translate_body(func.body)
-        self.indent_level -= 1
+        lines = self.translate_lines(func.body, level + 1)
         
-        if not body.strip():
-            body = self.get_indent() + '    '
-            if self.target_lang in ['python', 'ruby']:
-                body += 'pass'
-            else:
-                body += 'mero_empty'
-        
-        if self.target_lang == 'javascript':
-            return f"{self.get_indent()}function {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'typescript':
-            return f"{self.get_indent()}function {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'java':
-            return f"{self.get_indent()}public static void {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang in ['c', 'cpp']:
-            return f"{self.get_indent()}void {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'csharp':
-            return f"{self.get_indent()}public static void {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'go':
-            return f"{self.get_indent()}func {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'rust':
-            return f"{self.get_indent()}fn {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'php':
-            return f"{self.get_indent()}function {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'ruby':
-            return f"{self.get_indent()}def {func_name}({params})\n{body}\n{self.get_indent()}end"
-        elif self.target_lang == 'swift':
-            return f"{self.get_indent()}func {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'kotlin':
-            return f"{self.get_indent()}fun {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'perl':
-            return f"{self.get_indent()}sub {func_name} {{\n{self.get_indent()}    my ({params}) = @_;\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'lua':
-            return f"{self.get_indent()}function {func_name}({params})\n{body}\n{self.get_indent()}end"
-        elif self.target_lang == 'dart':
-            return f"{self.get_indent()}{func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'scala':
-            return f"{self.get_indent()}def {func_name}({params}) = {{\n{body}\n{self.get_indent()}}}"
+        if lines:
+            body = '\n'.join(lines)
         else:
-            return f"{self.get_indent()}function {func_name}({params}) {{\n{body}\n{self.get_indent()}}}"
+            body = _indent_for(level) + '    ' + self.profile.empty_body
+        
+        return self.profile.func_template.format(indent=_indent_for(level), name=func_name, params=params, body=body)
     
-    def translate_class(self, cls: ast.ClassDef) -> str:
+    def visit_ClassDef(self, cls: ast.ClassDef, level: int = 0) -> str:
         class_name = cls.name
-        self.indent_level += 1
-        body = self.translate_body(cls.body)
-        self.indent_level -= 1
+        body = self.translate_body(cls.body, level + 1)
         
-        if self.target_lang in ['javascript', 'typescript']:
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'java':
-            return f"{self.get_indent()}public class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang in ['c', 'cpp']:
-            return f"{self.get_indent()}class {class_name} {{\npublic:\n{body}\n{self.get_indent()}}};"
-        elif self.target_lang == 'csharp':
-            return f"{self.get_indent()}public class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'php':
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'ruby':
-            return f"{self.get_indent()}class {class_name}\n{body}\n{self.get_indent()}end"
-        elif self.target_lang == 'swift':
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'kotlin':
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'scala':
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
-        else:
-            return f"{self.get_indent()}class {class_name} {{\n{body}\n{self.get_indent()}}}"
+        return self.profile.class_template.format(indent=_indent_for(level), name=class_name, body=body)
     
-    def translate_assignment(self, assign: ast.Assign) -> str:
+    def visit_Assign(self, assign: ast.Assign, level: int = 0) -> str:
         target = self.translate_expr(assign.targets[0], is_assignment_target=True)
         value = self.translate_expr(assign.value)
         
         if isinstance(assign.targets[0], ast.Name):
             self.variables.add(assign.targets[0].id)
         
-        if self.target_lang == 'javascript':
-            return f"{self.get_indent()}let {target} = {value};"
-        elif self.target_lang == 'typescript':
-            return f"{self.get_indent()}let {target} = {value};"
-        elif self.target_lang == 'java':
-            return f"{self.get_indent()}var {target} = {value};"
-        elif self.target_lang in ['c', 'cpp']:
-            return f"{self.get_indent()}auto {target} = {value};"
-        elif self.target_lang == 'csharp':
-            return f"{self.get_indent()}var {target} = {value};"
-        elif self.target_lang == 'go':
-            return f"{self.get_indent()}{target} := {value}"
-        elif self.target_lang == 'rust':
-            return f"{self.get_indent()}let mut {target} = {value};"
-        elif self.target_lang == 'php':
-            php_target = f"${target}" if not target.startswith('$') else target
-            return f"{self.get_indent()}{php_target} = {value};"
-        elif self.target_lang == 'ruby':
-            return f"{self.get_indent()}{target} = {value}"
-        elif self.target_lang == 'swift':
-            return f"{self.get_indent()}var {target} = {value}"
-        elif self.target_lang == 'kotlin':
-            return f"{self.get_indent()}var {target} = {value}"
-        elif self.target_lang == 'perl':
-            return f"{self.get_indent()}my ${target} = {value};"
-        elif self.target_lang == 'lua':
-            return f"{self.get_indent()}local {target} = {value}"
-        elif self.target_lang == 'dart':
-            return f"{self.get_indent()}var {target} = {value};"
-        elif self.target_lang == 'scala':
-            return f"{self.get_indent()}val {target} = {value}"
-        else:
-            return f"{self.get_indent()}{target} = {value};"
+        return self.profile.assign_template.format(indent=_indent_for(level), target=target, value=value)
     
-    def translate_aug_assignment(self, aug: ast.AugAssign) -> str:
+    def visit_AugAssign(self, aug: ast.AugAssign, level: int = 0) -> str:
         target = self.translate_expr(aug.target)
         value = self.translate_expr(aug.value)
         op = self.translate_operator(aug.op)
         
         if self.target_lang == 'php':
             php_target = f"${target}" if not target.startswith('$') else target
-            return f"{self.get_indent()}{php_target} {op}= {value};"
+            return f"{_indent_for(level)}{php_target} {op}= {value};"
         else:
-            return f"{self.get_indent()}{target} {op}= {value};"
+            return f"{_indent_for(level)}{target} {op}= {value};"
     
-    def translate_if(self, if_stmt: ast.If) -> str:
+    def visit_If(self, if_stmt: ast.If, level: int = 0) -> str:
         condition = self.translate_expr(if_stmt.test)
-        self.indent_level += 1
-        if_body = self.translate_body(if_stmt.body)
-        self.indent_level -= 1
+        if_body = self.translate_body(if_stmt.body, level + 1)
         
-        result = ""
-        if self.target_lang in ['javascript', 'typescript', 'java', 'c', 'cpp', 'csharp', 'php', 'go', 'rust', 'swift', 'kotlin', 'dart', 'scala', 'perl']:
-            result = f"{self.get_indent()}if ({condition}) {{\n{if_body}\n{self.get_indent()}}}"
-        elif self.target_lang in ['ruby', 'lua']:
-            result = f"{self.get_indent()}if {condition} then\n{if_body}\n{self.get_indent()}end"
+        indent = _indent_for(level)
+        if self.profile.keyword_blocks:
+            result = f"{indent}if {condition} then\n{if_body}"
         else:
-            result = f"{self.get_indent()}if ({condition}) {{\n{if_body}\n{self.get_indent()}}}"
+            result = f"{indent}if ({condition}) {{\n{if_body}\n{indent}}}"
         
         if if_stmt.orelse:
-            self.indent_level += 1
-            else_body = self.translate_body(if_stmt.orelse)
-            self.indent_level -= 1
-            if self.target_lang in ['ruby', 'lua']:
-                result = result.rsplit('\n', 1)[0] + f"\n{self.get_indent()}else\n{else_body}\n{self.get_indent()}end"
+            else_body = self.translate_body(if_stmt.orelse, level + 1)
+            if self.profile.keyword_blocks:
+                result += f"\n{indent}else\n{else_body}"
             else:
-                result += f" else {{\n{else_body}\n{self.get_indent()}}}"
+                result += f" else {{\n{else_body}\n{indent}}}"
         
+        if self.profile.keyword_blocks:
+            result += f"\n{indent}end"
         return result
     
-    def translate_for(self, for_stmt: ast.For) -> str:
+    def visit_For(self, for_stmt: ast.For, level: int = 0) -> str:
         var = self.translate_expr(for_stmt.target, is_assignment_target=True)
         iterable = self.translate_expr(for_stmt.iter)
         
-        self.indent_level += 1
-        body = self.translate_body(for_stmt.body)
-        self.indent_level -= 1
+        body = self.translate_body(for_stmt.body, level + 1)
         
-        if self.target_lang == 'javascript':
-            return f"{self.get_indent()}for (let {var} of {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'typescript':
-            return f"{self.get_indent()}for (let {var} of {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'java':
-            return f"{self.get_indent()}for (var {var} : {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang in ['c', 'cpp']:
-            return f"{self.get_indent()}for (auto {var} : {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'csharp':
-            return f"{self.get_indent()}foreach (var {var} in {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'go':
-            return f"{self.get_indent()}for _, {var} := range {iterable} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'rust':
-            return f"{self.get_indent()}for {var} in {iterable} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'php':
-            php_var = f"${var}" if not var.startswith('$') else var
-            return f"{self.get_indent()}foreach ({iterable} as {php_var}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'ruby':
-            return f"{self.get_indent()}{iterable}.each do |{var}|\n{body}\n{self.get_indent()}end"
-        elif self.target_lang == 'swift':
-            return f"{self.get_indent()}for {var} in {iterable} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'kotlin':
-            return f"{self.get_indent()}for ({var} in {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'perl':
-            return f"{self.get_indent()}foreach my ${var} (@{{{iterable}}}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'lua':
-            return f"{self.get_indent()}for _, {var} in pairs({iterable}) do\n{body}\n{self.get_indent()}end"
-        elif self.target_lang == 'dart':
-            return f"{self.get_indent()}for (var {var} in {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang == 'scala':
-            return f"{self.get_indent()}for ({var} <- {iterable}) {{\n{body}\n{self.get_indent()}}}"
-        else:
-            return f"{self.get_indent()}for ({var} in {iterable}) {{\n{body}\n{self.get_indent()}}}"
+        if self.target_lang == 'php' and not var.startswith('$'):
+            var = f"${var}"
+        return self.profile.for_template.format(indent=_indent_for(level), var=var, iterable=iterable, body=body)
     
-    def translate_while(self, while_stmt: ast.While) -> str:
+    def visit_While(self, while_stmt: ast.While, level: int = 0) -> str:
         condition = self.translate_expr(while_stmt.test)
-        self.indent_level += 1
-        body = self.translate_body(while_stmt.body)
-        self.indent_level -= 1
+        body = self.translate_body(while_stmt.body, level + 1)
         
-        if self.target_lang == 'go':
-            return f"{self.get_indent()}for {condition} {{\n{body}\n{self.get_indent()}}}"
-        elif self.target_lang in ['ruby', 'lua']:
-            return f"{self.get_indent()}while {condition} do\n{body}\n{self.get_indent()}end"
-        else:
-            return f"{self.get_indent()}while ({condition}) {{\n{body}\n{self.get_indent()}}}"
+        return self.profile.while_template.format(indent=_indent_for(level), condition=condition, body=body)
     
-    def translate_return(self, ret: ast.Return) -> str:
+    def visit_Return(self, ret: ast.Return, level: int = 0) -> str:
         value = self.translate_expr(ret.value) if ret.value else ""
-        return f"{self.get_indent()}return{' ' + value if value else ''};"
+        return f"{_indent_for(level)}return{' ' + value if value else ''};"
     
-    def translate_expression_stmt(self, expr_stmt: ast.Expr) -> str:
+    def visit_Expr(self, expr_stmt: ast.Expr, level: int = 0) -> str:
         expr = self.translate_expr(expr_stmt.value)
-        if self.target_lang in ['ruby', 'lua']:
-            return f"{self.get_indent()}{expr}"
-        return f"{self.get_indent()}{expr};"
-    
-    def translate_pass(self) -> str:
-        if self.target_lang in ['ruby']:
-            return ""
-        elif self.target_lang == 'python':
-            return f"{self.get_indent()}pass"
-        else:
-            return f"{self.get_indent()};"
+        return f"{_indent_for(level)}{expr}{self.profile.stmt_end}"
+    
+    def translate_pass(self, level: int = 0) -> str:
+        return self.profile.pass_at(level)
     
     def translate_parameters(self, args: ast.arguments) -> str:
-        params = []
-        for arg in args.args:
-            if arg.arg != 'self':
-                if self.target_lang == 'php':
-                    params.append(f"${arg.arg}")
-                elif self.target_lang == 'perl':
-                    params.append(f"${arg.arg}")
-                else:
-                    params.append(arg.arg)
-        return ', '.join(params)
-    
-    def translate_body(self, body: List[Any]) -> str:
-        lines = []
-        for stmt in body:
-            translated = self.translate_statement(stmt)
-            if translated and translated.strip():
-                lines.append(translated)
-        
+        start = 1 if args.args and args.args[0].arg == 'self' else 0
+        prefix = self._param_prefix
+        return ', '.join([prefix + arg.arg for arg in args.args[start:]])
+    
+    def translate_body(self, body: List[Any], level: int = 0) -> str:
+        lines = self.translate_lines(body, level)
         if not lines:
-            return f"{self.get_indent()}    "
+            return f"{_indent_for(level)}    "
         
         return '\n'.join(lines)
     
+    def translate_lines(self, body: List[Any], level: int = 0) -> List[str]:
+        lines = []
+        for stmt in body:
+            translated = self.translate_statement(stmt, level)
+            if translated:
+                lines.append(translated)
+        return lines
+    
     def translate_expr(self, expr: Any, is_assignment_target: bool = False) -> str:
         if expr is None:
             return "null"
-        elif isinstance(expr, ast.Constant):
-            return self.translate_constant(expr.value)
-        elif isinstance(expr, ast.Name):
-            name = expr.id
-            if name in ['True', 'False', 'None']:
-                return self.translate_constant_name(name)
-            if self.target_lang == 'php' and not is_assignment_target:
-                return f"${name}"
-            return name
-        elif isinstance(expr, ast.Call):
-            return self.translate_call(expr)
-        elif isinstance(expr, ast.BinOp):
-            return self.translate_binop(expr)
-        elif isinstance(expr, ast.Compare):
-            return self.translate_compare(expr)
-        elif isinstance(expr, ast.Attribute):
-            return self.translate_attribute(expr)
-        elif isinstance(expr, ast.Subscript):
-            return self.translate_subscript(expr)
-        elif isinstance(expr, ast.List):
-            return self.translate_list(expr)
-        elif isinstance(expr, ast.Dict):
-            return self.translate_dict(expr)
-        elif isinstance(expr, ast.Tuple):
-            return self.translate_tuple(expr)
-        elif isinstance(expr, ast.UnaryOp):
-            return self.translate_unaryop(expr)
-        elif isinstance(expr, ast.BoolOp):
-            return self.translate_boolop(expr)
-        elif isinstance(expr, ast.IfExp):
-            return self.translate_ifexp(expr)
-        else:
-            return "mero_expr"
+        handler = self._expr_dispatch.get(type(expr))
+        return handler(expr) if handler else "mero_expr"
+    
+    def visit_Name(self, expr: ast.Name) -> str:
+        name = expr.id
+        if name in _CONSTANT_NAMES:
+            return self.translate_constant_name(name)
+        return name
+    
+    def visit_Constant(self, expr: ast.Constant) -> str:
+        return self.translate_constant(expr.value)
     
     def translate_constant(self, value: Any) -> str:
-        if value is None:
-            return "null"
-        elif value is True:
-            return "true"
-        elif value is False:
-            return "false"
-        elif isinstance(value, str):
-            escaped = value.replace('\\', '\\\\').replace('"', '\\"')
-            return f'"{escaped}"'
-        else:
-            return str(value)
+        try:
+            return _translate_constant(value)
+        except TypeError:
+            return _translate_constant.__wrapped__(value)
     
     def translate_constant_name(self, name: str) -> str:
-        if name == 'True':
-            return 'true'
-        elif name == 'False':
-            return 'false'
-        elif name == 'None':
-            return 'null'
-        return name
+        return _CONSTANT_NAMES.get(name, name)
     
-    def translate_call(self, call: ast.Call) -> str:
+    def visit_Call(self, call: ast.Call) -> str:
         func_expr = call.func
         func_name = ""
         
         if isinstance(func_expr, ast.Name):
+            handler = _BUILTIN_DISPATCH.get(func_expr.id)
+            if handler:
+                return handler(self, call.args)
             func_name = func_expr.id
         elif isinstance(func_expr, ast.Attribute):
-            func_name = self.translate_attribute(func_expr)
+            func_name = self.visit_Attribute(func_expr)
         else:
             func_name = self.translate_expr(func_expr)
         
         args = ', '.join([self.translate_expr(arg) for arg in call.args])
-        
-        if func_name == 'print':
-            if self.target_lang == 'javascript':
-                return f"console.log({args})"
-            elif self.target_lang == 'typescript':
-                return f"console.log({args})"
-            elif self.target_lang == 'java':
-                return f"System.out.println({args})"
-            elif self.target_lang in ['c', 'cpp']:
-                return f"std::cout << {args} << std::endl"
-            elif self.target_lang == 'csharp':
-                return f"Console.WriteLine({args})"
-            elif self.target_lang == 'go':
-                return f"fmt.Println({args})"
-            elif self.target_lang == 'rust':
-                return f'println!("{{}}", {args})'
-            elif self.target_lang == 'php':
-                return f"echo {args}"
-            elif self.target_lang == 'ruby':
-                return f"puts {args}"
-            elif self.target_lang == 'swift':
-                return f"print({args})"
-            elif self.target_lang == 'kotlin':
-                return f"println({args})"
-            elif self.target_lang == 'perl':
-                return f"print {args}"
-            elif self.target_lang == 'lua':
-                return f"print({args})"
-            elif self.target_lang == 'dart':
-                return f"print({args})"
-            elif self.target_lang == 'scala':
-                return f"println({args})"
-            else:
-                return f"print({args})"
-        
-        elif func_name == 'len':
-            if self.target_lang in ['javascript', 'typescript']:
-                return f"{args}.length"
-            elif self.target_lang == 'java':
-                return f"{args}.length"
-            elif self.target_lang in ['c', 'cpp']:
-                return f"{args}.size()"
-            elif self.target_lang == 'csharp':
-                return f"{args}.Length"
-            elif self.target_lang == 'go':
-                return f"len({args})"
-            elif self.target_lang == 'rust':
-                return f"{args}.len()"
-            elif self.target_lang == 'php':
-                return f"count({args})"
-            elif self.target_lang == 'ruby':
-                return f"{args}.length"
-            elif self.target_lang == 'swift':
-                return f"{args}.count"
-            elif self.target_lang == 'kotlin':
-                return f"{args}.size"
-            else:
-                return f"len({args})"
-        
-        elif func_name == 'str':
-            if self.target_lang in ['javascript', 'typescript']:
-                return f"String({args})"
-            elif self.target_lang == 'java':
-                return f"String.valueOf({args})"
-            elif self.target_lang in ['c', 'cpp']:
-                return f"std::to_string({args})"
-            elif self.target_lang == 'csharp':
-                return f"{args}.ToString()"
-            elif self.target_lang == 'go':
-                return f"fmt.Sprint({args})"
-            elif self.target_lang == 'rust':
-                return f"{args}.to_string()"
-            elif self.target_lang == 'php':
-                return f"strval({args})"
-            elif self.target_lang == 'ruby':
-                return f"{args}.to_s"
-            elif self.target_lang == 'swift':
-                return f"String({args})"
-            elif self.target_lang == 'kotlin':
-                return f"{args}.toString()"
-            else:
-                return f"String({args})"
-        
-        elif func_name == 'range':
-            if self.target_lang in ['javascript', 'typescript']:
-                if call.args:
-                    n = self.translate_expr(call.args[0])
-                    return f"Array.from({{length: {n}}}, (_, i) => i)"
-                else:
-                    return "[]"
-            elif self.target_lang == 'php':
-                if call.args:
-                    n = self.translate_expr(call.args[0])
-                    return f"range(0, {n} - 1)"
-                else:
-                    return "[]"
-            elif self.target_lang == 'ruby':
-                if call.args:
-                    n = self.translate_expr(call.args[0])
-                    return f"(0...{n})"
-                else:
-                    return "(0...0)"
-            else:
-                return f"range({args})"
-        
         return f"{func_name}({args})"
     
-    def translate_binop(self, binop: ast.BinOp) -> str:
+    def visit_BinOp(self, binop: ast.BinOp) -> str:
         left = self.translate_expr(binop.left)
         right = self.translate_expr(binop.right)
-        
-        is_string_concat = False
-        if isinstance(binop.op, ast.Add):
-            if isinstance(binop.left, ast.Constant) and isinstance(binop.left.value, str):
-                is_string_concat = True
-            elif isinstance(binop.right, ast.Constant) and isinstance(binop.right.value, str):
-                is_string_concat = True
-        
-        if is_string_concat and isinstance(binop.op, ast.Add):
-            if self.target_lang == 'php':
-                return f"{left} . {right}"
-            else:
-                return f"{left} + {right}"
-        
         op = self.translate_operator(binop.op)
         return f"{left} {op} {right}"
     
     def translate_operator(self, op: Any) -> str:
-        if isinstance(op, ast.Add):
-            if self.target_lang == 'php':
-                return "."
-            return "+"
-        elif isinstance(op, ast.Sub):
-            return "-"
-        elif isinstance(op, ast.Mult):
-            return "*"
-        elif isinstance(op, ast.Div):
-            return "/"
-        elif isinstance(op, ast.Mod):
-            return "%"
-        elif isinstance(op, ast.Pow):
-            if self.target_lang == 'php':
-                return "**"
-            return "**"
-        elif isinstance(op, ast.FloorDiv):
-            return "//"
-        else:
-            return "+"
+        return self.profile.binary_ops.get(type(op), "+")
     
-    def translate_compare(self, compare: ast.Compare) -> str:
+    def visit_Compare(self, compare: ast.Compare) -> str:
+        if len(compare.ops) == 1:
+            return f"{self.translate_expr(compare.left)} {self.translate_compare_op(compare.ops[0])} {self.translate_expr(compare.comparators[0])}"
         left = self.translate_expr(compare.left)
         parts = [left]
         
@@ -558,70 +518,34 @@ class PythonToTargetTranslator:
         return ' '.join(parts)
     
     def translate_compare_op(self, op: Any) -> str:
-        if isinstance(op, ast.Eq):
-            if self.target_lang in ['javascript', 'typescript', 'php']:
-                return "==="
-            return "=="
-        elif isinstance(op, ast.NotEq):
-            if self.target_lang in ['javascript', 'typescript', 'php']:
-                return "!=="
-            return "!="
-        elif isinstance(op, ast.Lt):
-            return "<"
-        elif isinstance(op, ast.LtE):
-            return "<="
-        elif isinstance(op, ast.Gt):
-            return ">"
-        elif isinstance(op, ast.GtE):
-            return ">="
-        else:
-            return "=="
+        return self.profile.compare_ops.get(type(op), "==")
     
-    def translate_attribute(self, attr: ast.Attribute) -> str:
+    def visit_Attribute(self, attr: ast.Attribute) -> str:
         value = self.translate_expr(attr.value)
-        if self.target_lang == 'php' and value == 'self':
-            return f"$this->{attr.attr}"
-        elif value == 'self':
-            if self.target_lang in ['javascript', 'typescript', 'java', 'csharp', 'kotlin', 'dart', 'scala']:
-                return f"this.{attr.attr}"
-            else:
-                return f"self.{attr.attr}"
+        if value == 'self':
+            return self.profile.self_prefix + attr.attr
         return f"{value}.{attr.attr}"
     
-    def translate_subscript(self, subscript: ast.Subscript) -> str:
+    def visit_Subscript(self, subscript: ast.Subscript) -> str:
         value = self.translate_expr(subscript.value)
         slice_val = self.translate_expr(subscript.slice)
         return f"{value}[{slice_val}]"
     
-    def translate_list(self, lst: ast.List) -> str:
-        elements = ', '.join([self.translate_expr(el) for el in lst.elts])
-        if self.target_lang == 'php':
-            return f"array({elements})"
-        return f"[{elements}]"
-    
-    def translate_dict(self, dct: ast.Dict) -> str:
-        pairs = []
-        for key, value in zip(dct.keys, dct.values):
-            key_str = self.translate_expr(key)
-            value_str = self.translate_expr(value)
-            if self.target_lang == 'php':
-                pairs.append(f"{key_str} => {value_str}")
-            else:
-                pairs.append(f"{key_str}: {value_str}")
-        
-        if self.target_lang == 'php':
-            return f"array({', '.join(pairs)})"
-        return f"{{{', '.join(pairs)}}}"
+    def visit_List(self, lst: ast.List) -> str:
+        open_, close = self.profile.list_emit
+        return open_ + ', '.join([self.translate_expr(el) for el in lst.elts]) + close
     
-    def translate_tuple(self, tpl: ast.Tuple) -> str:
-        elements = ', '.join([self.translate_expr(el) for el in tpl.elts])
-        if self.target_lang == 'php':
-            return f"array({elements})"
-        elif self.target_lang in ['javascript', 'typescript']:
-            return f"[{elements}]"
-        return f"({elements})"
+    def visit_Dict(self, dct: ast.Dict) -> str:
+        open_, close = self.profile.dict_emit
+        sep = self.profile.dict_pair_sep
+        pairs = [self.translate_expr(key) + sep + self.translate_expr(value) for key, value in zip(dct.keys, dct.values)]
+        return open_ + ', '.join(pairs) + close
+    
+    def visit_Tuple(self, tpl: ast.Tuple) -> str:
+        open_, close = self.profile.tuple_emit
+        return open_ + ', '.join([self.translate_expr(el) for el in tpl.elts]) + close
     
-    def translate_unaryop(self, unaryop: ast.UnaryOp) -> str:
+    def visit_UnaryOp(self, unaryop: ast.UnaryOp) -> str:
         operand = self.translate_expr(unaryop.operand)
         if isinstance(unaryop.op, ast.Not):
             return f"!{operand}"
@@ -632,24 +556,18 @@ class PythonToTargetTranslator:
         else:
             return operand
     
-    def translate_boolop(self, boolop: ast.BoolOp) -> str:
-        values = [self.translate_expr(v) for v in boolop.values]
-        if isinstance(boolop.op, ast.And):
-            return ' && '.join(values)
-        elif isinstance(boolop.op, ast.Or):
-            return ' || '.join(values)
-        else:
-            return ' && '.join(values)
+    def visit_BoolOp(self, boolop: ast.BoolOp) -> str:
+        sep = ' || ' if isinstance(boolop.op, ast.Or) else ' && '
+        if len(boolop.values) == 2:
+            return f"{self.translate_expr(boolop.values[0])}{sep}{self.translate_expr(boolop.values[1])}"
+        return sep.join([self.translate_expr(v) for v in boolop.values])
     
-    def translate_ifexp(self, ifexp: ast.IfExp) -> str:
+    def visit_IfExp(self, ifexp: ast.IfExp) -> str:
         test = self.translate_expr(ifexp.test)
         body = self.translate_expr(ifexp.body)
         orelse = self.translate_expr(ifexp.orelse)
         return f"{test} ? {body} : {orelse}"
     
-    def get_indent(self) -> str:
-        return '    ' * self.indent_level
-    
     def add_language_wrappers(self, code: str) -> str:
         if self.target_lang == 'java':
             lines = code.strip().split('\n')
@@ -657,10 +575,11 @@ class PythonToTargetTranslator:
             class_members = []
             
             for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('public static void') or stripped.startswith('public class') or stripped.startswith('class '):
+                if _JAVA_MEMBER_RE.match(line):
                     class_members.append(line)
-                elif stripped and not stripped.startswith('}') and not stripped.startswith('{'):
+                    continue
+                stripped = line.strip()
+                if stripped and stripped[0] not in '{}':
                     main_calls.append('        ' + stripped)
             
             class_body = '\n'.join(class_members)
@@ -686,21 +605,54 @@ class PythonToTargetTranslator:
     def fallback_translate(self, code: str) -> str:
         return code
 
+class PhpTranslator(PythonToTargetTranslator):
+    def translate_expr(self, expr: Any, is_assignment_target: bool = False) -> str:
+        if expr is None:
+            return "null"
+        if type(expr) is ast.Name:
+            return self.visit_Name(expr, is_assignment_target)
+        handler = self._expr_dispatch.get(type(expr))
+        return handler(expr) if handler else "mero_expr"
+    
+    def visit_Name(self, expr: ast.Name, is_assignment_target: bool = False) -> str:
+        name = expr.id
+        if name in _CONSTANT_NAMES:
+            return self.translate_constant_name(name)
+        if not is_assignment_target:
+            return f"${name}"
+        return name
+    
+    def visit_Assign(self, assign: ast.Assign, level: int = 0) -> str:
+        target = self.translate_expr(assign.targets[0], is_assignment_target=True)
+        value = self.translate_expr(assign.value)
+        
+        if isinstance(assign.targets[0], ast.Name):
+            self.variables.add(assign.targets[0].id)
+        
+        if not target.startswith('$'):
+            target = f"${target}"
+        return self.profile.assign_template.format(indent=_indent_for(level), target=target, value=value)
+    
+    def visit_Attribute(self, attr: ast.Attribute) -> str:
+        return f"{self.translate_expr(attr.value)}.{attr.attr}"
+
+_LANG_MAP = {
+    'python': 'python', 'java': 'java', 'c': 'c', 'c++': 'cpp',
+    'c#': 'csharp', 'javascript': 'javascript', 'typescript': 'typescript',
+    'go': 'go', 'rust': 'rust', 'ruby': 'ruby', 'php': 'php',
+    'swift': 'swift', 'kotlin': 'kotlin', 'perl': 'perl', 'lua': 'lua',
+    'dart': 'dart', 'scala': 'scala'
+}
+
 class CodeTranslator:
-    def __init__(self):
+    def __init__(self) -> None:
         self.mero_translator = True
     
     def smart_translate(self, code: str, from_lang: str, to_lang: str) -> str:
-        lang_map = {
-            'Python': 'python', 'Java': 'java', 'C': 'c', 'C++': 'cpp',
-            'C#': 'csharp', 'JavaScript': 'javascript', 'TypeScript': 'typescript',
-            'Go': 'go', 'Rust': 'rust', 'Ruby': 'ruby', 'PHP': 'php',
-            'Swift': 'swift', 'Kotlin': 'kotlin', 'Perl': 'perl', 'Lua': 'lua',
-            'Dart': 'dart', 'Scala': 'scala'
-        }
-        
-        from_lang_key = lang_map.get(from_lang, from_lang.lower())
-        to_lang_key = lang_map.get(to_lang, to_lang.lower())
+        from_lang_key = from_lang.lower()
+        from_lang_key = _LANG_MAP.get(from_lang_key, from_lang_key)
+        to_lang_key = to_lang.lower()
+        to_lang_key = _LANG_MAP.get(to_lang_key, to_lang_key)
         
         if from_lang_key == 'python':
             translator = PythonToTargetTranslator(to_lang_key)
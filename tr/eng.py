@@ -6,6 +6,9 @@ from cr.tmpl import get_credit_header
 
 console = Console()
 
+PROGRESS_OUTPUT_SIZE = 1024 * 1024
+LARGE_SOURCE_SIZE = 64 * 1024
+
 class TranslationEngine:
     def __init__(self):
         self.use_mero_engine = True
@@ -30,42 +33,53 @@ class TranslationEngine:
         
         console.print(f"\n[bold cyan]Translating from {source_lang['name']} to {target_lang['name']}...[/bold cyan]\n")
         
-        with open(source_file, 'r', encoding='utf-8', errors='ignore') as f:
-            source_code = f.read()
+        source_code = self._read_source(source_file)
         
         translated_code = self._mero_translation(source_code, source_lang, target_lang)
         
         credits = get_credit_header(target_lang['name'], target_lang['comment'])
-        final_code = credits + translated_code
         
         source_dir = os.path.dirname(source_file)
         source_name = os.path.splitext(os.path.basename(source_file))[0]
         target_ext = target_lang['ext'][0]
         output_file = os.path.join(source_dir, f"{source_name}_translated{target_ext}")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-        ) as progress:
-            task = progress.add_task("[cyan]Saving translated file...", total=100)
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                if i % 20 == 0:
-                    import time
-                    time.sleep(0.05)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(final_code)
+        if len(credits) + len(translated_code) > PROGRESS_OUTPUT_SIZE:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+            ) as progress:
+                task = progress.add_task("[cyan]Saving translated file...", total=100)
+                self._write_output(output_file, credits, translated_code)
+                progress.update(task, completed=100)
+        else:
+            self._write_output(output_file, credits, translated_code)
         
         console.print(f"\n[bold green]Translation completed successfully![/bold green]")
         console.print(f"[bold yellow]Output file: {output_file}[/bold yellow]\n")
         
         return output_file
     
+    def _read_source(self, source_file):
+        size = os.path.getsize(source_file)
+        if size <= LARGE_SOURCE_SIZE:
+            with open(source_file, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+        
+        with open(source_file, 'rb') as f:
+            source_code = f.read(size).decode('utf-8', 'ignore')
+        if '\r' in source_code:
+            source_code = source_code.replace('\r\n', '\n').replace('\r', '\n')
+        return source_code
+    
+    def _write_output(self, output_file, credits, code):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(credits)
+            f.write(code)
+    
     def _mero_translation(self, source_code, source_lang, target_lang):
         from tr.core import CodeTranslator
         
@@ -83,10 +97,7 @@ class TranslationEngine:
                 total=100
             )
             
-            import time
-            for i in range(0, 90, 10):
-                progress.update(task, completed=i)
-                time.sleep(0.05)
+            progress.update(task, completed=50)
             
             translated_code = translator.smart_translate(
                 source_code,
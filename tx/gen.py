@@ -1,10 +1,49 @@
 import os
 import re
 import json
-from typing import Dict, List, Any, Tuple, Optional, Set
+from typing import Callable, Dict, List, Any, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 import random
+from functools import lru_cache
+
+_PYTHON_UTILS_SRC = '''def mero_log(message):
+    print(f"[MERO] {message}")
+
+def mero_validate(data):
+    return data is not None
+
+def mero_transform(data, func):
+    return func(data)
+
+class MeroHelper:
+    @staticmethod
+    def process(data):
+        mero_log(f"Processing: {data}")
+        return data
+    
+    @staticmethod
+    def validate(value):
+        return mero_validate(value)
+'''
+
+_JAVASCRIPT_CONFIG_SRC = '''const config = {
+    projectName: "MeroProject",
+    version: "1.0.0",
+    debug: true,
+    meroEnabled: true
+};
+
+module.exports = config;
+'''
+
+_JAVA_CONFIG_SRC = '''public class Config {
+    public static final String PROJECT_NAME = "MeroProject";
+    public static final String VERSION = "1.0.0";
+    public static final boolean DEBUG = true;
+    public static final boolean MERO_ENABLED = true;
+}
+'''
 
 @dataclass
 class CodeTemplate:
@@ -13,13 +52,33 @@ class CodeTemplate:
     template: str
     variables: List[str] = field(default_factory=list)
     mero_template: bool = True
+    render_head: Callable[[Dict[str, str]], str] = field(init=False, repr=False, compare=False)
+    render_tail: Callable[[Dict[str, str]], str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        head, _, tail = self.template.partition('{body}')
+        self.render_head = head.format_map
+        self.render_tail = tail.format_map
 
 class CodeGenerator:
     def __init__(self):
         self.templates = self._initialize_templates()
+        self.template_index = self._index_templates(self.templates)
         self.mero_generator = True
         self.indentation_level = 0
         self.indentation_char = '    '
+        self._lines = []
+        self._block_generators = {
+            'function_def': self._generate_function,
+            'class_def': self._generate_class,
+            'if_stmt': self._generate_if,
+            'for_stmt': self._generate_for,
+            'while_stmt': self._generate_while
+        }
+        self._leaf_generators = {
+            'return_stmt': self._generate_return,
+            'expression': self._generate_expression
+        }
     
     def _initialize_templates(self) -> Dict[str, List[CodeTemplate]]:
         return {
@@ -122,128 +181,119 @@ class CodeGenerator:
             ]
         }
     
+    def _index_templates(self, templates: Dict[str, List[CodeTemplate]]) -> Dict[str, Dict[str, CodeTemplate]]:
+        return {language: {t.name: t for t in lang_templates} for language, lang_templates in templates.items()}
+    
     def generate_from_ast(self, ast: Any, language: str) -> str:
         self.indentation_level = 0
-        code_lines = []
+        self._lines = []
         
         if hasattr(ast, 'children'):
             for child in ast.children:
-                code = self._generate_node(child, language)
-                if code:
-                    code_lines.append(code)
+                self._generate_node(child, language, '')
         
+        code_lines = self._lines
+        self._lines = []
         return '\n'.join(code_lines)
     
-    def _generate_node(self, node: Any, language: str) -> str:
+    def _generate_node(self, node: Any, language: str, prefix: str):
         if not hasattr(node, 'node_type'):
-            return ''
+            return
         
         node_type = node.node_type
         
-        if node_type == 'function_def':
-            return self._generate_function(node, language)
-        elif node_type == 'class_def':
-            return self._generate_class(node, language)
-        elif node_type == 'if_stmt':
-            return self._generate_if(node, language)
-        elif node_type == 'for_stmt':
-            return self._generate_for(node, language)
-        elif node_type == 'while_stmt':
-            return self._generate_while(node, language)
-        elif node_type == 'return_stmt':
-            return self._generate_return(node, language)
-        elif node_type == 'expression':
-            return self._generate_expression(node, language)
-        else:
-            return f'mero_{node_type}'
+        generate = self._block_generators.get(node_type)
+        if generate:
+            generate(node, language, prefix)
+            return
+        
+        generate = self._leaf_generators.get(node_type)
+        self._append(generate(node, language) if generate else f'mero_{node_type}', prefix)
     
-    def _generate_function(self, node: Any, language: str) -> str:
-        name = node.attributes.get('name', 'unnamed_function')
-        params = node.attributes.get('params', [])
+    def _append(self, code: str, prefix: str):
+        if not code:
+            return
+        for line in code.split('\n'):
+            self._push(line, prefix)
+    
+    def _push(self, line: str, prefix: str):
+        self._lines.append(prefix + line if line.strip() else line)
+    
+    def _merge_line(self, index: int, before: str, after: str, prefix: str):
+        line = self._lines[index]
+        merged = before + (line[len(prefix):] if line.strip() else line) + after
+        self._lines[index] = prefix + merged if merged.strip() else merged
+    
+    def _generate_block(self, node: Any, language: str, prefix: str, template: CodeTemplate, template_vars: Dict[str, str]):
+        template_vars['indent'] = self._get_indent()
+        head_lines = template.render_head(template_vars).split('\n')
+        tail_lines = template.render_tail(template_vars).split('\n')
         
-        body_lines = []
+        for line in head_lines[:-1]:
+            self._push(line, prefix)
+        
+        start = len(self._lines)
         self.indentation_level += 1
+        child_prefix = prefix + self._get_indent()
         for child in getattr(node, 'children', []):
-            child_code = self._generate_node(child, language)
-            if child_code:
-                body_lines.append(self._indent(child_code))
+            self._generate_node(child, language, child_prefix)
         self.indentation_level -= 1
+        if len(self._lines) == start:
+            self._push('pass' if language == 'python' else '// mero empty', prefix + self._get_indent())
         
-        body = '\n'.join(body_lines) if body_lines else self._indent('pass' if language == 'python' else '// mero empty')
+        self._merge_line(start, head_lines[-1], '', prefix)
+        if tail_lines[0]:
+            self._merge_line(len(self._lines) - 1, '', tail_lines[0], prefix)
+        for line in tail_lines[1:]:
+            self._push(line, prefix)
+    
+    def _generate_function(self, node: Any, language: str, prefix: str):
+        name = node.attributes.get('name', 'unnamed_function')
+        params = node.attributes.get('params', [])
         
-        templates = self.templates.get(language, [])
-        func_template = next((t for t in templates if t.name == 'function'), None)
+        func_template = self.template_index.get(language, {}).get('function')
         
         if not func_template:
-            return f'function {name}({", ".join(params)}) mero'
+            self._append(f'function {name}({", ".join(params)}) mero', prefix)
+            return
         
-        return func_template.template.format(
-            name=name,
-            params=', '.join(params),
-            body=body,
-            indent=self._get_indent()
-        )
+        self._generate_block(node, language, prefix, func_template, {
+            'name': name,
+            'params': ', '.join(params)
+        })
     
-    def _generate_class(self, node: Any, language: str) -> str:
+    def _generate_class(self, node: Any, language: str, prefix: str):
         name = node.attributes.get('name', 'unnamed_class')
         bases = node.attributes.get('bases', [])
         
-        body_lines = []
-        self.indentation_level += 1
-        for child in getattr(node, 'children', []):
-            child_code = self._generate_node(child, language)
-            if child_code:
-                body_lines.append(self._indent(child_code))
-        self.indentation_level -= 1
-        
-        body = '\n'.join(body_lines) if body_lines else self._indent('pass' if language == 'python' else '// mero empty')
-        
-        templates = self.templates.get(language, [])
-        class_template = next((t for t in templates if t.name == 'class'), None)
+        class_template = self.template_index.get(language, {}).get('class')
         
         if not class_template:
-            return f'class {name} mero'
+            self._append(f'class {name} mero', prefix)
+            return
         
-        template_vars = {
-            'name': name,
-            'body': body,
-            'indent': self._get_indent()
-        }
+        template_vars = {'name': name}
         
         if 'bases' in class_template.variables:
             template_vars['bases'] = ', '.join(bases) if bases else ''
         
-        return class_template.template.format(**template_vars)
+        self._generate_block(node, language, prefix, class_template, template_vars)
     
-    def _generate_if(self, node: Any, language: str) -> str:
+    def _generate_if(self, node: Any, language: str, prefix: str):
         condition = node.attributes.get('condition', 'True')
         
         if hasattr(condition, 'attributes'):
             condition = self._generate_expression(condition, language)
         
-        body_lines = []
-        self.indentation_level += 1
-        for child in getattr(node, 'children', []):
-            child_code = self._generate_node(child, language)
-            if child_code:
-                body_lines.append(self._indent(child_code))
-        self.indentation_level -= 1
-        
-        body = '\n'.join(body_lines) if body_lines else self._indent('pass' if language == 'python' else '// mero empty')
-        
-        templates = self.templates.get(language, [])
-        if_template = next((t for t in templates if t.name == 'if'), None)
+        if_template = self.template_index.get(language, {}).get('if')
         
         if not if_template:
-            return f'if {condition} mero'
+            self._append(f'if {condition} mero', prefix)
+            return
         
-        return if_template.template.format(
-            condition=condition,
-            body=body,
-            indent=self._get_indent()
-        )
+        self._generate_block(node, language, prefix, if_template, {'condition': condition})
     
-    def _generate_for(self, node: Any, language: str) -> str:
+    def _generate_for(self, node: Any, language: str, prefix: str):
         loop_var = node.attributes.get('loop_var', 'i')
         iterable = node.attributes.get('iterable', 'range(10)')
         
@@ -252,56 +302,30 @@ class CodeGenerator:
         if hasattr(iterable, 'attributes'):
             iterable = self._generate_expression(iterable, language)
         
-        body_lines = []
-        self.indentation_level += 1
-        for child in getattr(node, 'children', []):
-            child_code = self._generate_node(child, language)
-            if child_code:
-                body_lines.append(self._indent(child_code))
-        self.indentation_level -= 1
-        
-        body = '\n'.join(body_lines) if body_lines else self._indent('pass' if language == 'python' else '// mero empty')
-        
-        templates = self.templates.get(language, [])
-        for_template = next((t for t in templates if t.name == 'for'), None)
+        for_template = self.template_index.get(language, {}).get('for')
         
         if not for_template:
-            return f'for {loop_var} in {iterable} mero'
+            self._append(f'for {loop_var} in {iterable} mero', prefix)
+            return
         
-        return for_template.template.format(
-            var=loop_var,
-            iterable=iterable,
-            body=body,
-            indent=self._get_indent()
-        )
+        self._generate_block(node, language, prefix, for_template, {
+            'var': loop_var,
+            'iterable': iterable
+        })
     
-    def _generate_while(self, node: Any, language: str) -> str:
+    def _generate_while(self, node: Any, language: str, prefix: str):
         condition = node.attributes.get('condition', 'True')
         
         if hasattr(condition, 'attributes'):
             condition = self._generate_expression(condition, language)
         
-        body_lines = []
-        self.indentation_level += 1
-        for child in getattr(node, 'children', []):
-            child_code = self._generate_node(child, language)
-            if child_code:
-                body_lines.append(self._indent(child_code))
-        self.indentation_level -= 1
-        
-        body = '\n'.join(body_lines) if body_lines else self._indent('pass' if language == 'python' else '// mero empty')
-        
-        templates = self.templates.get(language, [])
-        while_template = next((t for t in templates if t.name == 'while'), None)
+        while_template = self.template_index.get(language, {}).get('while')
         
         if not while_template:
-            return f'while {condition} mero'
+            self._append(f'while {condition} mero', prefix)
+            return
         
-        return while_template.template.format(
-            condition=condition,
-            body=body,
-            indent=self._get_indent()
-        )
+        self._generate_block(node, language, prefix, while_template, {'condition': condition})
     
     def _generate_return(self, node: Any, language: str) -> str:
         value = node.attributes.get('value', None)
@@ -332,11 +356,6 @@ class CodeGenerator:
         
         return ' '.join(expr_parts)
     
-    def _indent(self, code: str) -> str:
-        indent = self._get_indent()
-        lines = code.split('\n')
-        return '\n'.join(indent + line if line.strip() else line for line in lines)
-    
     def _get_indent(self) -> str:
         return self.indentation_char * self.indentation_level
     
@@ -347,20 +366,22 @@ class CodeGenerator:
             files['main.py'] = self._generate_python_main(project_name)
             files['__init__.py'] = f'mero_version = "1.0.0"\nmero_author = "@qp4rm"\n'
             files['config.py'] = self._generate_python_config(project_name)
-            files['utils.py'] = self._generate_python_utils()
+            files['utils.py'] = _PYTHON_UTILS_SRC
         
         elif language == 'javascript':
             files['index.js'] = self._generate_javascript_main(project_name)
             files['package.json'] = self._generate_package_json(project_name)
-            files['config.js'] = self._generate_javascript_config()
+            files['config.js'] = _JAVASCRIPT_CONFIG_SRC
         
         elif language == 'java':
             files['Main.java'] = self._generate_java_main(project_name)
-            files['Config.java'] = self._generate_java_config()
+            files['Config.java'] = _JAVA_CONFIG_SRC
         
         return files
     
-    def _generate_python_main(self, project_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_python_main(project_name: str) -> str:
         return f'''def main():
     print("Welcome to {project_name} powered by mero")
     mero_init()
@@ -376,7 +397,9 @@ if __name__ == "__main__":
     main()
 '''
     
-    def _generate_python_config(self, project_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_python_config(project_name: str) -> str:
         return f'''PROJECT_NAME = "{project_name}"
 VERSION = "1.0.0"
 DEBUG = True
@@ -390,28 +413,9 @@ CONFIG = {{
 }}
 '''
     
-    def _generate_python_utils(self) -> str:
-        return '''def mero_log(message):
-    print(f"[MERO] {message}")
-
-def mero_validate(data):
-    return data is not None
-
-def mero_transform(data, func):
-    return func(data)
-
-class MeroHelper:
-    @staticmethod
-    def process(data):
-        mero_log(f"Processing: {data}")
-        return data
-    
     @staticmethod
-    def validate(value):
-        return mero_validate(value)
-'''
-    
-    def _generate_javascript_main(self, project_name: str) -> str:
+    @lru_cache(maxsize=128)
+    def _generate_javascript_main(project_name: str) -> str:
         return f'''function main() {{
     console.log("Welcome to {project_name} powered by mero");
     meroInit();
@@ -429,18 +433,9 @@ function runApplication() {{
 main();
 '''
     
-    def _generate_javascript_config(self) -> str:
-        return '''const config = {
-    projectName: "MeroProject",
-    version: "1.0.0",
-    debug: true,
-    meroEnabled: true
-};
-
-module.exports = config;
-'''
-    
-    def _generate_package_json(self, project_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_package_json(project_name: str) -> str:
         return json.dumps({
             "name": project_name.lower().replace(' ', '-'),
             "version": "1.0.0",
@@ -455,7 +450,9 @@ module.exports = config;
             "license": "MIT"
         }, indent=2)
     
-    def _generate_java_main(self, project_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_java_main(project_name: str) -> str:
         class_name = project_name.replace(' ', '')
         return f'''public class {class_name} {{
     public static void main(String[] args) {{
@@ -472,15 +469,6 @@ module.exports = config;
         System.out.println("Application running with mero optimization");
     }}
 }}
-'''
-    
-    def _generate_java_config(self) -> str:
-        return '''public class Config {
-    public static final String PROJECT_NAME = "MeroProject";
-    public static final String VERSION = "1.0.0";
-    public static final boolean DEBUG = true;
-    public static final boolean MERO_ENABLED = true;
-}
 '''
     
     def generate_test_cases(self, language: str, function_name: str, params: List[str]) -> str:
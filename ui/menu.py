@@ -1,3 +1,4 @@
+from functools import lru_cache
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -6,9 +7,18 @@ from dt.lang import LANGUAGES
 
 console = Console()
 
-def show_main_menu():
+@lru_cache(maxsize=None)
+def _render(print_menu, width, *args):
+    with console.capture() as capture:
+        print_menu(*args)
+    return capture.get()
+
+def _show(print_menu, *args):
     console.clear()
-    
+    console.file.write(_render(print_menu, console.width, *args))
+    console.file.flush()
+
+def _print_main_menu():
     table = Table(title="[bold cyan]CodeAlchemist - Main Menu[/bold cyan]", show_header=True, header_style="bold magenta")
     table.add_column("Number", style="cyan", width=10)
     table.add_column("Option", style="green")
@@ -20,13 +30,14 @@ def show_main_menu():
     
     console.print(table)
     console.print()
+
+def show_main_menu():
+    _show(_print_main_menu)
     
     choice = Prompt.ask("[bold yellow]Choose an option[/bold yellow]", choices=["0", "1", "2", "3"])
     return choice
 
-def show_languages_menu(current_lang=None):
-    console.clear()
-    
+def _print_languages_menu(current_lang):
     console.print(Panel(
         "[bold green]Available Programming Languages[/bold green]",
         border_style="cyan"
@@ -55,9 +66,10 @@ def show_languages_menu(current_lang=None):
     
     console.print()
 
-def show_compression_menu():
-    console.clear()
-    
+def show_languages_menu(current_lang=None):
+    _show(_print_languages_menu, current_lang)
+
+def _print_compression_menu():
     table = Table(title="[bold cyan]Compression Options[/bold cyan]", show_header=True, header_style="bold magenta")
     table.add_column("Number", style="cyan", width=10)
     table.add_column("Format", style="green")
@@ -76,6 +88,9 @@ def show_compression_menu():
     
     console.print(table)
     console.print()
+
+def show_compression_menu():
+    _show(_print_compression_menu)
     
     choice = Prompt.ask("[bold yellow]Choose compression format[/bold yellow]", choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"])
     return choice